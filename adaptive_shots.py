@@ -0,0 +1,105 @@
+"""
+Adaptive Shot Allocation with Early Stopping
+Runs a circuit in small shot batches and stops as soon as the leading outcome
+is statistically separated from the runner-up, or the shot budget is spent
+"""
+
+import math
+
+import numpy as np
+from scipy.stats import norm
+
+def wilson_interval(successes, trials, z):
+    """Wilson score interval for a binomial proportion"""
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denominator = 1 + z**2 / trials
+    center = (p + z**2 / (2 * trials)) / denominator
+    half_width = z * np.sqrt(p * (1 - p) / trials + z**2 / (4 * trials**2)) / denominator
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+def _leaders(counts):
+    ranked = sorted(counts.items(), key=lambda x: x[1], reverse=True)
+    leader = ranked[0]
+    runner_up = ranked[1] if len(ranked) > 1 else (None, 0)
+    return leader, runner_up
+
+def is_separated(counts, confidence=0.99, method='wilson', rng=None):
+    """
+    True if the most frequent outcome is separated from the runner-up.
+
+    method='wilson': the leader's Wilson lower bound exceeds the runner-up's
+        upper bound (each interval at confidence, Bonferroni-corrected).
+    method='bayes': the posterior probability that the leader's true
+        frequency exceeds the runner-up's, under a flat Dirichlet prior,
+        is at least confidence.
+    """
+    shots = sum(counts.values())
+    (_, lead), (_, second) = _leaders(counts)
+
+    if method == 'wilson':
+        z = norm.ppf(1 - (1 - confidence) / 4)
+        lead_low, _ = wilson_interval(lead, shots, z)
+        _, second_high = wilson_interval(second, shots, z)
+        return lead_low > second_high
+    if method == 'bayes':
+        rng = rng if rng is not None else np.random.default_rng(0)
+        samples = rng.dirichlet([lead + 1, second + 1, shots - lead - second + 1], size=4000)
+        return float(np.mean(samples[:, 0] > samples[:, 1])) >= confidence
+    raise ValueError(f"Unknown method '{method}', use 'wilson' or 'bayes'")
+
+def run_adaptive(run_batch, max_shots=2048, batch_shots=32, confidence=0.99,
+                 method='wilson', min_shots=None):
+    """
+    Accumulates counts batch by batch until the leader is separated.
+
+    Args:
+        run_batch: Callable (shots) -> counts dictionary
+        max_shots: Shot budget
+        batch_shots: Shots per batch
+        confidence: Required separation level for the run as a whole. The
+            leader is checked after every batch, so each check uses
+            1 - (1 - confidence) / (number of possible checks) (Bonferroni)
+            to keep the chance of a false early stop at 1 - confidence
+        method: 'wilson' or 'bayes'
+        min_shots: Shots to take before the first stopping check
+            (default: one batch)
+
+    Returns:
+        (counts, shots used, True if stopped before the budget)
+    """
+    min_shots = batch_shots if min_shots is None else min_shots
+    batches = math.ceil(max_shots / batch_shots)
+    checks = max(1, batches - max(1, math.ceil(min_shots / batch_shots)) + 1)
+    per_check = 1 - (1 - confidence) / checks
+    counts = {}
+    used = 0
+    while used < max_shots:
+        batch = min(batch_shots, max_shots - used)
+        for key, value in run_batch(batch).items():
+            counts[key] = counts.get(key, 0) + value
+        used += batch
+        if used >= min_shots and is_separated(counts, per_check, method):
+            return counts, used, used < max_shots
+    return counts, used, False
+
+def main():
+    """Compares adaptive and fixed shot counts for the 4-qubit test cases"""
+    from grover_simulator import simulate_grover
+
+    print("="*70)
+    print("ADAPTIVE SHOT ALLOCATION")
+    print("="*70)
+
+    for n, secret in [(2, 3), (3, 5), (4, 10)]:
+        seeds = iter(range(1000))
+        counts, used, early = run_adaptive(
+            lambda shots: simulate_grover(n, secret, shots=shots, seed=next(seeds))
+        )
+        found = int(max(counts.items(), key=lambda x: x[1])[0], 2)
+        print(f"  n={n}, target={secret}: found {found} with {used} shots "
+              f"({'early stop' if early else 'budget exhausted'}, fixed mode uses 2048)")
+
+if __name__ == "__main__":
+    main()
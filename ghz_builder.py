@@ -0,0 +1,259 @@
+"""
+Coupling-Map-Aware GHZ State Builder
+Builds a GHZ circuit from a shallow spanning tree of the device connectivity
+graph, so every CNOT acts on a physical edge (no SWAPs) and the CNOT layers
+grow the entangled set as fast as the topology allows
+"""
+
+from qiskit import QuantumCircuit, transpile
+from qiskit.transpiler import CouplingMap
+import rustworkx as rx
+
+def _undirected_graph(coupling_map):
+    if isinstance(coupling_map, CouplingMap):
+        graph = coupling_map.graph
+    elif isinstance(coupling_map, (rx.PyGraph, rx.PyDiGraph)):
+        graph = coupling_map
+    else:
+        graph = CouplingMap(coupling_map).graph
+    if isinstance(graph, rx.PyDiGraph):
+        graph = graph.to_undirected(multigraph=False)
+    return graph
+
+def _bfs_tree(graph, root, num_qubits):
+    """
+    BFS spanning tree over the num_qubits nodes closest to root.
+    Returns (nodes in BFS order, {node: children}).
+    """
+    order = [root]
+    children = {root: []}
+    head = 0
+    while head < len(order) and len(order) < num_qubits:
+        node = order[head]
+        head += 1
+        for neighbor in sorted(graph.neighbors(node)):
+            if neighbor in children:
+                continue
+            children[node].append(neighbor)
+            children[neighbor] = []
+            order.append(neighbor)
+            if len(order) == num_qubits:
+                break
+    return order, children
+
+def _broadcast_schedule(root, children):
+    """
+    Optimal CNOT ordering for a fixed tree: every entangled qubit feeds one
+    child per layer, children with the slowest subtrees first.
+
+    Returns:
+        (number of CNOT layers, list of (layer, control, target))
+    """
+    finish = {}
+
+    def subtree_time(node):
+        # Iterative post-order, deep trees (line topologies) would overflow
+        # Python's recursion limit
+        stack = [(node, False)]
+        while stack:
+            current, expanded = stack.pop()
+            if current in finish:
+                continue
+            if not expanded:
+                stack.append((current, True))
+                stack.extend((c, False) for c in children[current])
+                continue
+            children[current].sort(key=lambda c: finish[c], reverse=True)
+            finish[current] = max(
+                [i + 1 + finish[c] for i, c in enumerate(children[current])],
+                default=0,
+            )
+        return finish[node]
+
+    layers = subtree_time(root)
+    schedule = []
+    queue = [(root, 0)]
+    while queue:
+        node, start = queue.pop()
+        for i, child in enumerate(children[node]):
+            schedule.append((start + i + 1, node, child))
+            queue.append((child, start + i + 1))
+    schedule.sort()
+    return layers, schedule
+
+def _greedy_schedule(graph, root, members):
+    """
+    Layer-by-layer broadcast on the induced subgraph: every entangled qubit
+    entangles one new neighbour per layer, pushing outward from the root
+    first. On dense connectivity this doubles the GHZ size each layer
+    (log depth), where a BFS tree would degenerate into a star.
+
+    Returns:
+        (number of CNOT layers, list of (layer, control, target))
+    """
+    members = set(members)
+    distance = {root: 0}
+    frontier = [root]
+    while frontier:
+        next_frontier = []
+        for node in frontier:
+            for neighbor in graph.neighbors(node):
+                if neighbor in members and neighbor not in distance:
+                    distance[neighbor] = distance[node] + 1
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+
+    entangled = [root]
+    pending = members - {root}
+    schedule = []
+    layer = 0
+    while pending:
+        layer += 1
+        options = {node: [nb for nb in graph.neighbors(node) if nb in pending]
+                   for node in entangled}
+        claimed = set()
+        # Most constrained controls choose first
+        for node in sorted(entangled, key=lambda v: (len(options[v]), v)):
+            choices = [nb for nb in options[node] if nb not in claimed]
+            if not choices:
+                continue
+            target = max(choices, key=lambda nb: (
+                distance[nb], sum(1 for x in graph.neighbors(nb) if x in pending), -nb))
+            claimed.add(target)
+            schedule.append((layer, node, target))
+        if not claimed:
+            break  # disconnected remainder
+        pending -= claimed
+        entangled.extend(sorted(claimed))
+    return layer, schedule
+
+def plan_ghz(coupling_map, num_qubits=None, root=None):
+    """
+    Picks the root and spanning tree that minimise the number of CNOT layers.
+
+    Args:
+        coupling_map: CouplingMap, rustworkx graph or edge list (e.g.
+            backend.coupling_map)
+        num_qubits: GHZ size (default: the whole device)
+        root: Physical root qubit (default: try every qubit and keep the
+            best-connected one)
+
+    Returns:
+        Dictionary with 'root', 'layout' (virtual -> physical qubit),
+        'cnot_layers' and 'schedule' of (layer, control, target) on physical
+        qubits
+    """
+    graph = _undirected_graph(coupling_map)
+    nodes = list(graph.node_indices())
+    if num_qubits is None:
+        num_qubits = len(nodes)
+    if num_qubits > len(nodes):
+        raise ValueError(f"Device has {len(nodes)} qubits, cannot build a {num_qubits}-qubit GHZ")
+
+    candidates = [root] if root is not None else nodes
+    best = None
+    for candidate in candidates:
+        order, children = _bfs_tree(graph, candidate, num_qubits)
+        if len(order) < num_qubits:
+            continue  # root's connected component is too small
+        layers, schedule = _broadcast_schedule(candidate, children)
+        greedy_layers, greedy_schedule = _greedy_schedule(graph, candidate, order)
+        if greedy_layers < layers:
+            layers, schedule = greedy_layers, greedy_schedule
+        key = (layers, -graph.degree(candidate))
+        if best is None or key < best[0]:
+            best = (key, candidate, order, layers, schedule)
+
+    if best is None:
+        raise ValueError(f"No connected set of {num_qubits} qubits in the coupling map")
+
+    _, root, order, layers, schedule = best
+    return {
+        'root': root,
+        'layout': order,
+        'cnot_layers': layers,
+        'schedule': schedule,
+    }
+
+def build_ghz_circuit(coupling_map, num_qubits=None, root=None, measure=True):
+    """
+    Builds a GHZ circuit whose CNOTs follow the device coupling map.
+
+    The circuit is compact (num_qubits wide, virtual qubit 0 is the root);
+    pass the returned layout as initial_layout when transpiling so every CNOT
+    lands on a physical edge.
+
+    Returns:
+        (QuantumCircuit, layout) where layout[i] is the physical qubit for
+        virtual qubit i
+    """
+    plan = plan_ghz(coupling_map, num_qubits, root)
+    layout = plan['layout']
+    virtual = {physical: i for i, physical in enumerate(layout)}
+
+    qc = QuantumCircuit(len(layout), name=f"ghz_{len(layout)}")
+    qc.h(0)
+    for _, control, target in plan['schedule']:
+        qc.cx(virtual[control], virtual[target])
+    if measure:
+        qc.measure_all()
+    return qc, layout
+
+def build_linear_ghz(num_qubits, measure=True):
+    """Fan-out GHZ from qubit 0, as in the Garnet notebook's simulator example"""
+    qc = QuantumCircuit(num_qubits)
+    qc.h(0)
+    for qb in range(1, num_qubits):
+        qc.cx(0, qb)
+    if measure:
+        qc.measure_all()
+    return qc
+
+def ghz_depth_report(qc, layout, backend, optimization_level=1):
+    """
+    Transpiles a GHZ circuit onto backend with its planned layout and reports
+    depth before and after, plus the number of two-qubit gates (equal to
+    num_qubits - 1 when no SWAPs were inserted).
+    """
+    tqc = transpile(qc, backend, initial_layout=layout,
+                    optimization_level=optimization_level)
+    # measure_all()'s barrier spans every qubit, so it is a 2-qubit
+    # instruction on a 2-qubit GHZ; skip it
+    two_qubit = sum(1 for inst in tqc.data
+                    if inst.operation.num_qubits == 2 and inst.operation.name != 'barrier')
+    report = {
+        'num_qubits': qc.num_qubits,
+        'depth_before': qc.depth(),
+        'depth_after': tqc.depth(),
+        'two_qubit_gates': two_qubit,
+        'swap_free': two_qubit == qc.num_qubits - 1,
+    }
+
+    print(f"  GHZ-{report['num_qubits']}: depth {report['depth_before']} -> "
+          f"{report['depth_after']} after transpile, "
+          f"{two_qubit} two-qubit gates ({'no SWAPs' if report['swap_free'] else 'SWAPs inserted'})")
+    return report, tqc
+
+def main():
+    """Compares fan-out and tree GHZ circuits on an offline Garnet-like lattice"""
+    from qiskit.providers.fake_provider import GenericBackendV2
+
+    print("="*70)
+    print("COUPLING-MAP-AWARE GHZ BUILDER")
+    print("="*70)
+
+    # 20 qubits on a square lattice, as on IQM Garnet
+    coupling_map = CouplingMap.from_grid(4, 5)
+    backend = GenericBackendV2(num_qubits=20, coupling_map=coupling_map, seed=1)
+
+    linear = build_linear_ghz(20)
+    tlinear = transpile(linear, backend, optimization_level=1, seed_transpiler=1)
+    print(f"\nFan-out from qubit 0: depth {linear.depth()} -> {tlinear.depth()} after transpile")
+
+    print("\nSpanning-tree GHZ:")
+    for n in [5, 10, 20]:
+        qc, layout = build_ghz_circuit(coupling_map, n)
+        ghz_depth_report(qc, layout, backend)
+
+if __name__ == "__main__":
+    main()
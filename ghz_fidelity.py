@@ -0,0 +1,204 @@
+"""
+Stabilizer Fast Path and GHZ Fidelity Estimation
+Validates Clifford circuits (such as GHZ preparation) with the stabilizer
+simulator at any size, and estimates GHZ fidelity from population plus
+parity-oscillation measurements with vectorized operations on the shot array
+"""
+
+from qiskit import QuantumCircuit, transpile
+from qiskit.exceptions import QiskitError
+from qiskit.primitives import BitArray
+from qiskit.quantum_info import Clifford, StabilizerState
+from qiskit_aer import AerSimulator
+import numpy as np
+
+_STABILIZER_GATES = {'h', 'x', 'y', 'z', 's', 'sdg', 'cx', 'cz', 'swap', 'measure', 'barrier'}
+
+# Number of set bits in every byte value
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+
+def _without_measurements(qc):
+    return qc.remove_final_measurements(inplace=False)
+
+def is_clifford(qc):
+    """True if the unitary part of qc is a Clifford circuit"""
+    try:
+        Clifford(_without_measurements(qc))
+        return True
+    except QiskitError:
+        return False
+
+def run_clifford(qc, shots=10000, noise_model=None, seed=None):
+    """
+    Samples a Clifford circuit with Aer's stabilizer method, which scales
+    polynomially in the number of qubits (100+ qubit GHZ runs in milliseconds
+    where a statevector run is impossible beyond ~30 qubits).
+    """
+    if not is_clifford(qc):
+        raise ValueError(f"Circuit '{qc.name}' is not Clifford, use a statevector simulator")
+    simulator = AerSimulator(method='stabilizer', noise_model=noise_model)
+    # Circuits already in stabilizer gates skip the (comparatively slow)
+    # transpile of a 100+ qubit circuit
+    if not set(qc.count_ops()) <= _STABILIZER_GATES:
+        qc = transpile(qc, simulator)
+    return simulator.run(qc, shots=shots, seed_simulator=seed).result().get_counts()
+
+def validate_ghz_stabilizer(qc):
+    """
+    Exact check that qc prepares (|0...0> + |1...1>)/sqrt(2), by comparing
+    its stabilizer state with a reference fan-out GHZ (polynomial in the
+    number of qubits, no statevector needed).
+    """
+    base = _without_measurements(qc)
+    reference = QuantumCircuit(base.num_qubits)
+    reference.h(0)
+    for qb in range(1, base.num_qubits):
+        reference.cx(0, qb)
+    return StabilizerState(base).equiv(StabilizerState(reference))
+
+def _shot_array(data):
+    """
+    Normalizes shot data to (packed bit rows, weights, number of bits).
+    Accepts a counts dict, a Sampler BitArray, or a (shots x bits) 0/1 array.
+    """
+    if isinstance(data, dict):
+        keys = [k.replace(' ', '') for k in data]
+        num_bits = len(keys[0])
+        bits = (np.frombuffer(''.join(keys).encode('ascii'), dtype=np.uint8)
+                .reshape(len(keys), num_bits) - ord('0'))
+        weights = np.fromiter(data.values(), dtype=np.float64, count=len(keys))
+        return np.packbits(bits, axis=1), weights, num_bits
+    if isinstance(data, BitArray):
+        array = data.array.reshape(-1, data.array.shape[-1])
+        return array, np.ones(len(array)), data.num_bits
+    bits = np.asarray(data, dtype=np.uint8)
+    return np.packbits(bits, axis=1), np.ones(len(bits)), bits.shape[1]
+
+def ghz_population(data):
+    """Fraction of shots that are all zeros or all ones"""
+    packed, weights, num_bits = _shot_array(data)
+    ones = _POPCOUNT[packed].sum(axis=1)
+    hits = (ones == 0) | (ones == num_bits)
+    return float(weights[hits].sum() / weights.sum())
+
+def parity_expectation(data):
+    """<(-1)^(number of ones)> over all shots"""
+    packed, weights, _ = _shot_array(data)
+    signs = 1 - 2 * (_POPCOUNT[packed].sum(axis=1) & 1)
+    return float(np.dot(signs, weights) / weights.sum())
+
+def ghz_parity_circuits(ghz, num_phases=4):
+    """
+    Parity-oscillation circuits: a phase theta on one qubit rotates the GHZ
+    coherence, then every qubit is measured in the X basis. The parity then
+    oscillates as C * cos(theta). With the default 4 phases (multiples of
+    pi/2) the circuits stay Clifford; other phases use a p(theta) gate.
+
+    Returns:
+        (list of circuits, array of phases)
+    """
+    base = _without_measurements(ghz)
+    phases = 2 * np.pi * np.arange(num_phases) / num_phases
+    circuits = []
+    for theta in phases:
+        qc = base.copy(name=f"{base.name}_parity_{theta:.3f}")
+        quarter_turns = theta / (np.pi / 2)
+        if np.isclose(quarter_turns, round(quarter_turns)):
+            # Multiples of pi/2 as Clifford gates, for the stabilizer method
+            for _ in range(int(round(quarter_turns)) % 4):
+                qc.s(0)
+        else:
+            qc.p(theta, 0)
+        qc.h(range(qc.num_qubits))
+        qc.measure_all()
+        circuits.append(qc)
+    return circuits, phases
+
+def estimate_ghz_fidelity(population_data, parity_data, phases):
+    """
+    GHZ fidelity F = (P_00..0 + P_11..1) / 2 + C / 2, where C is the
+    amplitude of the parity oscillation fitted over the measured phases.
+
+    Args:
+        population_data: Z-basis shots of the GHZ circuit
+        parity_data: One shot set per parity circuit
+        phases: Phases used to build the parity circuits
+
+    Returns:
+        Dictionary with 'fidelity', 'population', 'coherence' and 'parities'
+    """
+    population = ghz_population(population_data)
+    parities = np.array([parity_expectation(d) for d in parity_data])
+    phases = np.asarray(phases)
+    # Phases are evenly spaced over 2*pi, so the Fourier components are the
+    # least-squares fit of C * cos(theta + phi0)
+    a = 2 * np.mean(parities * np.cos(phases))
+    b = 2 * np.mean(parities * np.sin(phases))
+    coherence = float(np.hypot(a, b))
+    return {
+        'fidelity': (population + coherence) / 2,
+        'population': population,
+        'coherence': coherence,
+        'parities': parities,
+    }
+
+def _run_parity_circuit(qc, shots, noise_model, seed):
+    """
+    Clifford parity circuits take the stabilizer fast path. Other phases
+    use the matrix-product-state method, which is still cheap for GHZ
+    states (bond dimension 2) at 100+ qubits.
+    """
+    if is_clifford(qc):
+        return run_clifford(qc, shots, noise_model, seed)
+    simulator = AerSimulator(method='matrix_product_state', noise_model=noise_model)
+    job = simulator.run(transpile(qc, simulator), shots=shots, seed_simulator=seed)
+    return job.result().get_counts()
+
+def measure_ghz_fidelity(ghz, shots=10000, num_phases=4, noise_model=None, seed=None):
+    """
+    Runs population and parity circuits, on the stabilizer fast path where
+    the phases allow it (num_phases a multiple of 4 keeps every circuit
+    Clifford).
+
+    Args:
+        num_phases: Evenly spaced parity phases; at least 3, as fewer do
+            not determine the oscillation amplitude
+    """
+    if num_phases < 3:
+        raise ValueError(f"num_phases must be at least 3 to fit the parity oscillation, got {num_phases}")
+    population = run_clifford(ghz, shots, noise_model, seed)
+    circuits, phases = ghz_parity_circuits(ghz, num_phases)
+    parity = [_run_parity_circuit(qc, shots, noise_model, seed) for qc in circuits]
+    return estimate_ghz_fidelity(population, parity, phases)
+
+def main():
+    """Validates and scores a 120-qubit GHZ circuit offline"""
+    import time
+    from qiskit.transpiler import CouplingMap
+    from qiskit_aer.noise import NoiseModel, depolarizing_error
+
+    from ghz_builder import build_ghz_circuit
+
+    print("="*70)
+    print("STABILIZER GHZ VALIDATION")
+    print("="*70)
+
+    ghz, _ = build_ghz_circuit(CouplingMap.from_heavy_hex(9), 120)
+    print(f"  GHZ-{ghz.num_qubits}: depth {ghz.depth()}")
+
+    start = time.time()
+    print(f"  Exact stabilizer check: {'✓ PASS' if validate_ghz_stabilizer(ghz) else '✗ FAIL'}"
+          f" ({time.time() - start:.3f}s)")
+
+    noise = NoiseModel()
+    noise.add_all_qubit_quantum_error(depolarizing_error(0.002, 2), ['cx'])
+    for label, model in [("ideal", None), ("0.2% CX depolarizing", noise)]:
+        start = time.time()
+        result = measure_ghz_fidelity(ghz, shots=1000, noise_model=model, seed=1)
+        print(f"\n  {label}:")
+        print(f"    Population: {result['population']:.4f}")
+        print(f"    Coherence:  {result['coherence']:.4f}")
+        print(f"    Fidelity:   {result['fidelity']:.4f} ({time.time() - start:.3f}s)")
+
+if __name__ == "__main__":
+    main()
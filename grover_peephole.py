@@ -0,0 +1,192 @@
+"""
+Grover-Specific Peephole Optimizer
+Opens the Oracle/Diffuser wrappers and pushes every X and Z through the
+circuit as a per-qubit Pauli frame before the general transpiler sees it.
+The oracle's X mask rides through the diffuser's H/X layers (X -> Z through
+H, Z commutes with the multi-controlled phase) and cancels against the next
+oracle's mask, so the masks of all iterations collapse into one layer in
+front of the measurement, and the diffuser's X layers merge with it.
+Adjacent self-inverse pairs (H.H, X.X, ...) left behind are cancelled too.
+The result equals the input up to global phase
+"""
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Gate, Instruction
+from qiskit.circuit.library import XGate, ZGate
+from qiskit.converters import circuit_to_dag, dag_to_circuit
+from qiskit.transpiler.basepasses import TransformationPass
+
+SELF_INVERSE = {'h', 'x', 'y', 'z', 'cx', 'cz', 'swap', 'ccx'}
+MULTI_CONTROLLED_X = {'ccx', 'mcx', 'c3x', 'c4x'}
+
+def _is_wrapper(op):
+    """Custom to_gate() blocks (Oracle, Diffuser, ...) that can be opened"""
+    return type(op) in (Gate, Instruction) and op.definition is not None
+
+def _flatten(qc, qubits=None, clbits=None):
+    """Yields (operation, qubit indices, clbit indices) with wrappers opened"""
+    qubits = qubits if qubits is not None else list(range(qc.num_qubits))
+    clbits = clbits if clbits is not None else list(range(qc.num_clbits))
+    for instruction in qc.data:
+        op = instruction.operation
+        q = [qubits[qc.find_bit(b).index] for b in instruction.qubits]
+        c = [clbits[qc.find_bit(b).index] for b in instruction.clbits]
+        if _is_wrapper(op):
+            yield from _flatten(op.definition, q, c)
+        else:
+            yield op, q, c
+
+class _FrameCircuit:
+    """
+    Output gate list with per-qubit Pauli frames. frame_x[q]/frame_z[q]
+    mark a pending X/Z on qubit q that has not been emitted yet.
+    """
+
+    def __init__(self, num_qubits):
+        self.ops = []
+        self.frame_x = [0] * num_qubits
+        self.frame_z = [0] * num_qubits
+        self._last = [[] for _ in range(num_qubits)]  # output indices per qubit
+
+    def emit(self, op, qubits, clbits=()):
+        if (op.name in SELF_INVERSE and not clbits and
+                all(self._last[q] for q in qubits)):
+            index = self._last[qubits[0]][-1]
+            previous = self.ops[index]
+            if (previous is not None and previous[0].name == op.name and
+                    list(previous[1]) == list(qubits) and
+                    all(self._last[q][-1] == index for q in qubits)):
+                self.ops[index] = None
+                for q in qubits:
+                    self._last[q].pop()
+                return
+        self.ops.append((op, list(qubits), list(clbits)))
+        for q in qubits:
+            self._last[q].append(len(self.ops) - 1)
+
+    def flush(self, qubits, x=True, z=True):
+        """Emits the pending frame on these qubits"""
+        for q in qubits:
+            if z and self.frame_z[q]:
+                self.frame_z[q] = 0
+                self.emit(ZGate(), [q])
+            if x and self.frame_x[q]:
+                self.frame_x[q] = 0
+                self.emit(XGate(), [q])
+
+def push_pauli_frames(qc):
+    """
+    Peephole-optimizes a Grover circuit by Pauli-frame propagation.
+
+    Rules for a pending X/Z frame meeting a gate:
+        X, Z, Y gates: absorbed into the frame
+        H: X and Z swap
+        CX/CZ: conjugated (X_c -> X_c X_t, Z_t -> Z_c Z_t for CX; X_a -> X_a Z_b for CZ)
+        multi-controlled X: Z on controls and X on the target commute;
+            X on a control or Z on the target is emitted first
+        measure: Z dropped, X emitted
+        anything else: frame emitted first
+
+    Returns:
+        New QuantumCircuit (equal to qc up to global phase)
+    """
+    out = _FrameCircuit(qc.num_qubits)
+    fx, fz = out.frame_x, out.frame_z
+
+    for op, qubits, clbits in _flatten(qc):
+        name = op.name
+        if name == 'x':
+            fx[qubits[0]] ^= 1
+        elif name == 'z':
+            fz[qubits[0]] ^= 1
+        elif name == 'y':
+            fx[qubits[0]] ^= 1
+            fz[qubits[0]] ^= 1
+        elif name == 'h':
+            q = qubits[0]
+            fx[q], fz[q] = fz[q], fx[q]
+            out.emit(op, qubits)
+        elif name == 'cx':
+            c, t = qubits
+            fx[t] ^= fx[c]
+            fz[c] ^= fz[t]
+            out.emit(op, qubits)
+        elif name == 'cz':
+            a, b = qubits
+            fz[b] ^= fx[a]
+            fz[a] ^= fx[b]
+            out.emit(op, qubits)
+        elif name in MULTI_CONTROLLED_X and op.ctrl_state == 2**(len(qubits) - 1) - 1:
+            *controls, target = qubits
+            out.flush(controls, x=True, z=False)
+            out.flush([target], x=False, z=True)
+            out.emit(op, qubits)
+        elif name == 'measure':
+            out.flush(qubits, x=True, z=False)
+            fz[qubits[0]] = 0
+            out.emit(op, qubits, clbits)
+        elif name == 'barrier':
+            out.flush(qubits)
+            out.emit(op, qubits)
+        else:
+            out.flush(qubits)
+            out.emit(op, qubits, clbits)
+
+    out.flush(range(qc.num_qubits))
+
+    result = QuantumCircuit(*qc.qregs, *qc.cregs, name=qc.name)
+    result.global_phase = qc.global_phase
+    for entry in out.ops:
+        if entry is not None:
+            op, qubits, clbits = entry
+            result.append(op, [result.qubits[q] for q in qubits],
+                          [result.clbits[c] for c in clbits])
+    return result
+
+class GroverPeephole(TransformationPass):
+    """push_pauli_frames as a transpiler pass, e.g. for a pre_init stage"""
+
+    def run(self, dag):
+        return circuit_to_dag(push_pauli_frames(dag_to_circuit(dag)))
+
+def gate_summary(qc):
+    """Total operation count with custom wrappers opened, and 1-qubit share"""
+    total = single = 0
+    for op, qubits, _ in _flatten(qc):
+        if op.name in ('measure', 'barrier'):
+            continue
+        total += 1
+        single += len(qubits) == 1
+    return {'gates': total, 'single_qubit': single}
+
+def main():
+    """Gate counts, and hardware depth at optimization level 0, with and without the pass"""
+    import time
+
+    from qiskit import transpile
+    from qiskit_ibm_runtime.fake_provider import FakeFez
+
+    from quantum_sudoku_decrypt import grover_circuit
+
+    backend = FakeFez()
+    print("="*70)
+    print("GROVER PEEPHOLE OPTIMIZER")
+    print("="*70)
+    print(f"  {'n':>3} {'secret':>7} {'gates in':>9} {'after':>7} {'1q in':>7} {'1q after':>9} "
+          f"{'depth':>7} {'depth opt':>10}")
+    for n, secret in [(4, 5), (6, 20), (8, 77)]:
+        qc = grover_circuit(n, secret)
+
+        start = time.time()
+        optimized = push_pauli_frames(qc)
+        elapsed = time.time() - start
+
+        before, after = gate_summary(qc), gate_summary(optimized)
+        depth = transpile(qc, backend, optimization_level=0, seed_transpiler=1).depth()
+        depth_opt = transpile(optimized, backend, optimization_level=0, seed_transpiler=1).depth()
+        print(f"  {n:3d} {secret:7d} {before['gates']:9d} {after['gates']:7d} "
+              f"{before['single_qubit']:7d} {after['single_qubit']:9d} {depth:7d} {depth_opt:10d}"
+              f"  ({elapsed * 1000:.1f} ms)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Single-Pass Grover Iteration Sweep
+Applies Grover iterations once and records the marked-state probability after
+every iteration, giving the full success curve for k = 0..K in one run instead
+of one circuit per k
+"""
+
+from qiskit import QuantumCircuit
+from qiskit_aer import AerSimulator
+import numpy as np
+
+from grover_simulator import (_normalize_marked, apply_grover_iteration,
+                              initial_state, optimal_iterations)
+from ibm_quantum_location_decrypt import grover_iteration_plan
+from quantum_sudoku_decrypt import diffuser, make_oracle
+from transpile_service import DEFAULT_SERVICE
+
+def analytic_success_probability(n, k, num_marked=1):
+    """
+    Exact probability of measuring a marked state after k iterations:
+    sin^2((2k+1) * theta) with sin(theta) = sqrt(M/N).
+    Works for any n, including sizes far beyond simulation.
+    """
+    theta = np.arcsin(np.sqrt(num_marked / 2**n))
+    return np.sin((2 * np.asarray(k) + 1) * theta) ** 2
+
+def _sweep_result(n, num_marked, success):
+    success = np.asarray(success, dtype=np.float64)
+    best = int(np.argmax(success))
+    return {
+        'n': n,
+        'num_marked': num_marked,
+        'k': np.arange(len(success)),
+        'success': success,
+        'optimal_k': best,
+        'optimal_probability': float(success[best]),
+        'formula_k': optimal_iterations(n, num_marked),
+    }
+
+def sweep_iterations_numpy(n, marked, max_iterations=None):
+    """
+    Sweeps k = 0..max_iterations on the NumPy engine, snapshotting the
+    marked-state probability after each iteration (K oracle applications in
+    total rather than K^2 / 2).
+
+    Returns:
+        Dictionary with the 'success' curve, 'optimal_k' (empirical),
+        'optimal_probability' and 'formula_k' (floor(pi/4 sqrt(N/M)))
+    """
+    marked = _normalize_marked(n, marked)
+    if max_iterations is None:
+        max_iterations = 2 * optimal_iterations(n, len(marked)) + 1
+
+    amplitudes = initial_state(n)
+    success = np.empty(max_iterations + 1)
+    success[0] = np.sum(amplitudes[marked] ** 2)
+    for k in range(1, max_iterations + 1):
+        apply_grover_iteration(amplitudes, marked)
+        success[k] = np.sum(amplitudes[marked] ** 2)
+
+    return _sweep_result(n, len(marked), success)
+
+def sweep_iterations_aer(secret, n, max_iterations=None):
+    """
+    Sweeps k = 0..max_iterations with a single Aer statevector run, using a
+    save_probabilities instruction after every Grover iteration of the same
+    gate-level circuit that run_grover_search builds.
+    """
+    if max_iterations is None:
+        max_iterations = 2 * optimal_iterations(n) + 1
+
+    qc = QuantumCircuit(n)
+    qc.h(range(n))
+    qc.save_probabilities(label="k0")
+    oracle = make_oracle(n, secret)
+    diff = diffuser(n)
+    for k in range(1, max_iterations + 1):
+        qc.append(oracle, range(n))
+        qc.append(diff, range(n))
+        qc.save_probabilities(label=f"k{k}")
+
+    simulator = AerSimulator(method='statevector')
+    tqc = DEFAULT_SERVICE.transpile(qc, simulator)
+    data = simulator.run(tqc).result().data()
+
+    success = [data[f"k{k}"][secret] for k in range(max_iterations + 1)]
+    return _sweep_result(n, 1, success)
+
+def print_sweep(result, max_rows=12):
+    """Prints a sweep curve and compares the empirical optimum to the formula"""
+    print(f"\n{'='*70}")
+    print(f"ITERATION SWEEP: {result['n']} qubits, {result['num_marked']} marked")
+    print(f"{'='*70}")
+
+    step = max(1, len(result['success']) // max_rows)
+    for k in range(0, len(result['success']), step):
+        p = result['success'][k]
+        print(f"  k={k:5d}: {p*100:6.2f}% {'█' * int(p * 40)}")
+
+    formula_k = result['formula_k']
+    print(f"\n  Empirical optimum: k={result['optimal_k']} "
+          f"({result['optimal_probability']*100:.2f}%)")
+    if formula_k < len(result['success']):
+        print(f"  Formula floor(pi/4 sqrt(N/M)): k={formula_k} "
+              f"({result['success'][formula_k]*100:.2f}%)")
+
+def check_iteration_caps():
+    """
+    Success probability under the iteration caps used by quantum_key_search,
+    compared with the uncapped formula.
+    """
+    print(f"\n{'='*70}")
+    print("QUANTUM_KEY_SEARCH ITERATION CAPS")
+    print(f"{'='*70}")
+
+    for n in [16, 24, 32, 40, 64]:
+        _, capped = grover_iteration_plan(n)
+        p_capped = analytic_success_probability(n, capped)
+        p_optimal = analytic_success_probability(n, optimal_iterations(n))
+        print(f"  n={n:3d}: k={capped:5d} -> {p_capped:.3e} "
+              f"(optimal k={optimal_iterations(n)} -> {p_optimal:.4f})")
+
+def main():
+    result = sweep_iterations_numpy(12, 1234)
+    print_sweep(result)
+
+    result = sweep_iterations_aer(5, 4)
+    print_sweep(result)
+
+    check_iteration_caps()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Statistical Validation of Grover Outputs Against the Analytic Reference
+Compares observed counts with the exact output distribution for (n, k,
+marked set) using chi-squared and total-variation tests at a controlled
+false-failure rate, instead of a fixed confidence threshold
+"""
+
+import time
+
+import numpy as np
+from scipy.stats import binomtest, chi2
+
+from grover_simulator import _normalize_marked, optimal_iterations, simulate_grover
+from grover_sweep import analytic_success_probability
+
+def theoretical_probabilities(n, k, marked):
+    """
+    Exact Grover output after k iterations: the success probability
+    sin^2((2k+1) theta) is shared equally by the marked states and the
+    remainder equally by the unmarked ones.
+
+    Returns:
+        (probability of each marked state, probability of each unmarked state)
+    """
+    marked = _normalize_marked(n, marked)
+    num_marked = len(marked)
+    success = float(analytic_success_probability(n, k, num_marked))
+    num_unmarked = 2**n - num_marked
+    per_unmarked = (1 - success) / num_unmarked if num_unmarked else 0.0
+    return success / num_marked, per_unmarked
+
+def _categories(counts, n, k, marked, min_expected=5):
+    """
+    Observed and expected counts per category. Unmarked outcomes are tested
+    individually when each expects at least min_expected hits, and lumped
+    into one category otherwise.
+    """
+    marked = _normalize_marked(n, marked)
+    shots = sum(counts.values())
+    p_marked, p_unmarked = theoretical_probabilities(n, k, marked)
+
+    observed_by_index = {int(key.replace(' ', ''), 2): v for key, v in counts.items()}
+    observed = [observed_by_index.get(m, 0) for m in marked]
+    expected = [p_marked * shots] * len(marked)
+
+    marked_set = set(marked)
+    unmarked_total = shots - sum(observed)
+    if p_unmarked * shots >= min_expected:
+        unmarked = [i for i in range(2**n) if i not in marked_set]
+        observed += [observed_by_index.get(i, 0) for i in unmarked]
+        expected += [p_unmarked * shots] * len(unmarked)
+    else:
+        observed.append(unmarked_total)
+        expected.append(p_unmarked * (2**n - len(marked)) * shots)
+    return np.array(observed, dtype=np.float64), np.array(expected, dtype=np.float64)
+
+def chi_squared_test(counts, n, k, marked, alpha=0.01, min_expected=5):
+    """
+    Pearson chi-squared goodness of fit to the analytic distribution.
+    Outcomes with zero expected probability must not be observed at all
+    (e.g. the unmarked states of a 2-qubit search). Categories expecting
+    fewer than min_expected hits, where the chi-squared approximation breaks
+    down (the unmarked remainder near the optimal iteration count), are
+    pooled and checked with an exact binomial test instead; the two p-values
+    are Bonferroni-combined.
+
+    Returns:
+        Dictionary with 'passed', 'statistic', 'p_value' and 'dof'
+    """
+    observed, expected = _categories(counts, n, k, marked, min_expected)
+    shots = observed.sum()
+    impossible = expected <= 1e-9 * shots
+    if np.any(observed[impossible] > 0):
+        return {'passed': False, 'statistic': np.inf, 'p_value': 0.0, 'dof': 0}
+    observed, expected = observed[~impossible], expected[~impossible]
+
+    p_values = []
+    small = expected < min_expected
+    if np.any(small):
+        p_values.append(binomtest(int(observed[small].sum()), int(shots),
+                                  min(1.0, expected[small].sum() / shots)).pvalue)
+        observed, expected = observed[~small], expected[~small]
+        # Conditional on the pooled count, the rest is multinomial again
+        expected = expected * observed.sum() / expected.sum() if expected.sum() > 0 else expected
+
+    statistic, dof = 0.0, len(observed) - 1
+    if dof > 0 and observed.sum() > 0:
+        statistic = float(np.sum((observed - expected)**2 / expected))
+        p_values.append(float(chi2.sf(statistic, dof)))
+
+    p_value = min(1.0, len(p_values) * min(p_values)) if p_values else 1.0
+    return {'passed': p_value >= alpha, 'statistic': statistic, 'p_value': p_value,
+            'dof': max(dof, 0)}
+
+def total_variation_test(counts, n, k, marked, alpha=0.01):
+    """
+    Total-variation distance between observed and analytic category
+    frequencies, against the distribution-free threshold from the L1
+    concentration bound P(||p_hat - p||_1 >= eps) <= (2^K - 2) exp(-shots eps^2 / 2),
+    so a correct sampler fails with probability at most alpha.
+    """
+    observed, expected = _categories(counts, n, k, marked)
+    shots = observed.sum()
+    distance = 0.5 * float(np.abs(observed - expected).sum() / shots)
+    num_categories = len(observed)
+    log_terms = np.log(max(2.0**num_categories - 2, 1.0)) if num_categories < 1000 \
+        else num_categories * np.log(2)
+    threshold = 0.5 * np.sqrt(2 / shots * (log_terms - np.log(alpha)))
+    return {'passed': bool(distance <= threshold), 'distance': distance,
+            'threshold': float(threshold)}
+
+def validate_case(counts, n, k, marked, alpha=0.01):
+    """Runs both tests; a case passes only if both pass at level alpha"""
+    chi = chi_squared_test(counts, n, k, marked, alpha / 2)
+    tv = total_variation_test(counts, n, k, marked, alpha / 2)
+    return {'passed': chi['passed'] and tv['passed'], 'chi_squared': chi, 'total_variation': tv}
+
+def validate_grover_engine(cases, shots=2048, alpha=0.01, seed=0, engine=None):
+    """
+    Validates many (n, marked) cases, with a family-wise false-failure rate
+    of alpha (Bonferroni across cases).
+
+    Args:
+        cases: Iterable of (n, marked) or (n, marked, iterations)
+        engine: Callable (n, marked, iterations, shots, seed) -> counts;
+            defaults to the NumPy engine
+
+    Returns:
+        List of per-case result dictionaries
+    """
+    if engine is None:
+        def engine(n, marked, iterations, shots, seed):
+            return simulate_grover(n, marked, iterations=iterations, shots=shots, seed=seed)
+
+    cases = [tuple(c) for c in cases]
+    per_case_alpha = alpha / len(cases)
+    results = []
+    for i, case in enumerate(cases):
+        n, marked = case[0], case[1]
+        num_marked = len(_normalize_marked(n, marked))
+        k = case[2] if len(case) > 2 else optimal_iterations(n, num_marked)
+        counts = engine(n, marked, k, shots, seed + i)
+        result = validate_case(counts, n, k, marked, per_case_alpha)
+        result.update({'n': n, 'marked': marked, 'iterations': k})
+        results.append(result)
+    return results
+
+def main():
+    """Validates every n up to 20 with several secrets each"""
+    rng = np.random.default_rng(0)
+    cases = [(n, int(s)) for n in range(1, 21)
+             for s in rng.choice(2**n, size=min(2**n, 5), replace=False)]
+
+    print("="*70)
+    print(f"ANALYTIC-REFERENCE VALIDATION ({len(cases)} cases, family-wise alpha = 1%)")
+    print("="*70)
+
+    start = time.time()
+    results = validate_grover_engine(cases)
+    elapsed = time.time() - start
+
+    failures = [r for r in results if not r['passed']]
+    for r in results[::5]:
+        chi = r['chi_squared']
+        print(f"  n={r['n']:2d} target={r['marked']:7d} k={r['iterations']:4d}: "
+              f"chi2 p={chi['p_value']:.3f}, TV={r['total_variation']['distance']:.4f} "
+              f"{'✓' if r['passed'] else '✗'}")
+    print(f"\n  Passed: {len(results) - len(failures)}/{len(results)} in {elapsed:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""
+Offline Hardware Emulation with Fake Backends
+Stands in for QiskitRuntimeService with a local fake device snapshot
+(default: 156-qubit Heron-class FakeFez). Circuits are transpiled against
+the device's real coupling map and native gates, executed on Aer with the
+device noise model, and returned through jobs that sit in a simulated
+queue, so the hardware code path (job handling, result parsing, readout
+mitigation) runs on CI machines without network access
+"""
+
+import itertools
+import time
+
+from qiskit import QuantumCircuit
+from qiskit.primitives import BitArray, DataBin, PrimitiveResult, SamplerPubResult
+from qiskit.providers import BackendV2, JobStatus, Options
+from qiskit_aer import AerSimulator
+from qiskit_aer.noise import NoiseModel
+from qiskit_aer.noise.device import basic_device_gate_errors, basic_device_readout_errors
+from qiskit_ibm_runtime.exceptions import IBMBackendError
+import numpy as np
+
+DEFAULT_QUEUE_SECONDS = 2.0
+
+class EmulatedJob:
+    """
+    Job that reports QUEUED until its simulated queue time has passed; the
+    circuit executes when the result is first requested.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, backend, execute, queue_seconds):
+        self.backend = backend
+        self._execute = execute
+        self._job_id = f"emulated-{backend.name}-{next(self._ids):06d}"
+        self.submitted = time.monotonic()
+        self.ready_at = self.submitted + queue_seconds
+        self._result = None
+
+    def job_id(self):
+        return self._job_id
+
+    def status(self):
+        if self._result is not None:
+            return JobStatus.DONE
+        return JobStatus.QUEUED if time.monotonic() < self.ready_at else JobStatus.RUNNING
+
+    def done(self):
+        return self._result is not None
+
+    def result(self):
+        if self._result is None:
+            time.sleep(max(0.0, self.ready_at - time.monotonic()))
+            self._result = self._execute()
+        return self._result
+
+class EmulatedBackend(BackendV2):
+    """
+    A fake device snapshot behind the hardware interface: ISA circuits only,
+    device noise, queue latency. As on IBM hardware, backend.run() is
+    rejected; jobs are submitted through EmulatedSampler.
+
+    Execution only simulates the physical qubits a circuit touches, with the
+    matching slice of the device noise model, so a 156-qubit target costs
+    no more than the circuit's own width.
+    """
+
+    def __init__(self, fake_backend, queue_seconds=DEFAULT_QUEUE_SECONDS, seed=None):
+        super().__init__(name=fake_backend.name, backend_version=fake_backend.backend_version)
+        self.fake_backend = fake_backend
+        self.queue_seconds = queue_seconds
+        self._rng = np.random.default_rng(seed)
+        self._gate_errors = None
+        self._readout_errors = None
+        self._noise_models = {}
+
+    @property
+    def target(self):
+        return self.fake_backend.target
+
+    @property
+    def max_circuits(self):
+        return None
+
+    @classmethod
+    def _default_options(cls):
+        return Options(shots=4096)
+
+    def properties(self):
+        return self.fake_backend.properties()
+
+    def _queue_time(self):
+        """Exponentially distributed queue wait with the configured mean"""
+        return float(self._rng.exponential(self.queue_seconds)) if self.queue_seconds > 0 else 0.0
+
+    def _noise_model(self, active):
+        """Device noise restricted to the active physical qubits, renumbered"""
+        model = self._noise_models.get(active)
+        if model is not None:
+            return model
+        if self._gate_errors is None:
+            # Derived once per backend: ~seconds for a 156-qubit target
+            self._gate_errors = basic_device_gate_errors(target=self.target)
+            self._readout_errors = basic_device_readout_errors(target=self.target)
+
+        index = {q: i for i, q in enumerate(active)}
+        model = NoiseModel(basis_gates=list(self.target.operation_names))
+        for name, qubits, error in self._gate_errors:
+            if all(q in index for q in qubits):
+                model.add_quantum_error(error, name, [index[q] for q in qubits])
+        for qubits, error in self._readout_errors:
+            if all(q in index for q in qubits):
+                model.add_readout_error(error, [index[q] for q in qubits])
+        self._noise_models[active] = model
+        return model
+
+    def _check_isa(self, qc):
+        """Rejects circuits the device cannot run, as the hardware would"""
+        if qc.num_qubits != self.num_qubits and qc.layout is None:
+            raise ValueError(
+                f"Circuit has {qc.num_qubits} qubits but {self.name} expects ISA circuits "
+                f"on its {self.num_qubits} physical qubits; transpile it for this backend first"
+            )
+        for instruction in qc.data:
+            name = instruction.operation.name
+            if name == 'barrier':
+                continue
+            qargs = tuple(qc.find_bit(q).index for q in instruction.qubits)
+            if not self.target.instruction_supported(name, qargs):
+                raise ValueError(f"Instruction {name} on qubits {qargs} is not supported by {self.name}")
+
+    def _simulate(self, qc, shots, seed):
+        """Counts for one ISA circuit on its active qubits with device noise"""
+        self._check_isa(qc)
+        active = tuple(sorted({qc.find_bit(q).index for instruction in qc.data
+                               for q in instruction.qubits}))
+        index = {q: i for i, q in enumerate(active)}
+        compact = QuantumCircuit(len(active), name=qc.name)
+        for creg in qc.cregs:
+            compact.add_register(creg)
+        for instruction in qc.data:
+            compact.append(instruction.operation,
+                           [index[qc.find_bit(q).index] for q in instruction.qubits],
+                           instruction.clbits)
+        simulator = AerSimulator(noise_model=self._noise_model(active))
+        return simulator.run(compact, shots=shots, seed_simulator=seed).result().get_counts()
+
+    def run(self, run_input, **options):
+        """Rejected like IBMBackend.run: jobs go through the Sampler primitive"""
+        raise IBMBackendError(
+            "Support for backend.run() has been removed. Use the Sampler primitive "
+            "(hardware_emulation.sampler_for(backend)) instead."
+        )
+
+def _split_registers(qc, counts):
+    """Per-register counts from Aer keys ('cregN ... creg0')"""
+    by_register = {creg.name: {} for creg in qc.cregs}
+    for key, value in counts.items():
+        parts = key.split()
+        for creg, bits in zip(qc.cregs, reversed(parts)):
+            register = by_register[creg.name]
+            register[bits] = register.get(bits, 0) + value
+    return by_register
+
+class EmulatedSampler:
+    """SamplerV2-shaped front end: returns PrimitiveResult/BitArray data like the runtime"""
+
+    def __init__(self, mode):
+        self.backend = mode
+
+    def run(self, pubs, shots=None):
+        circuits = [pub[0] if isinstance(pub, tuple) else pub for pub in pubs]
+        shots = shots or 1024
+        backend = self.backend
+        seed = int(backend._rng.integers(2**31))
+
+        def execute():
+            results = []
+            for i, qc in enumerate(circuits):
+                counts = backend._simulate(qc, shots, seed + i)
+                data = {name: BitArray.from_counts(register_counts or {'0' * creg.size: 0},
+                                                   num_bits=creg.size)
+                        for creg, (name, register_counts)
+                        in zip(qc.cregs, _split_registers(qc, counts).items())}
+                results.append(SamplerPubResult(DataBin(**data, shape=()), metadata={'shots': shots}))
+            return PrimitiveResult(results, metadata={'emulated': True})
+
+        return EmulatedJob(backend, execute, backend._queue_time())
+
+def is_runtime_backend(backend):
+    """True for backends that only run through the runtime primitives"""
+    from qiskit_ibm_runtime import IBMBackend
+    return isinstance(backend, (IBMBackend, EmulatedBackend))
+
+def sampler_for(backend):
+    """Runtime Sampler for real backends, EmulatedSampler for emulated ones"""
+    if isinstance(backend, EmulatedBackend):
+        return EmulatedSampler(backend)
+    from qiskit_ibm_runtime import Sampler
+    return Sampler(backend)
+
+class FakeRuntimeService:
+    """
+    Drop-in for QiskitRuntimeService in the code paths this project uses
+    (backends, least_busy, backend).
+    """
+
+    def __init__(self, backends=None, queue_seconds=DEFAULT_QUEUE_SECONDS, seed=None):
+        if backends is None:
+            from qiskit_ibm_runtime.fake_provider import FakeFez
+            backends = [FakeFez()]
+        self._backends = [EmulatedBackend(b, queue_seconds, None if seed is None else seed + i)
+                          for i, b in enumerate(backends)]
+
+    def backends(self, name=None, min_num_qubits=None, operational=True, simulator=False, **kwargs):
+        if simulator:
+            return []
+        return [b for b in self._backends
+                if (name is None or b.name == name)
+                and (min_num_qubits is None or b.num_qubits >= min_num_qubits)]
+
+    def least_busy(self, min_num_qubits=None, operational=True, simulator=False, **kwargs):
+        candidates = self.backends(min_num_qubits=min_num_qubits, simulator=simulator)
+        if not candidates:
+            raise ValueError("No emulated backend matches the request")
+        return candidates[0]
+
+    def backend(self, name=None):
+        matches = self.backends(name=name)
+        if not matches:
+            raise ValueError(f"No emulated backend named '{name}'")
+        return matches[0]
+
+def main():
+    """A 4-qubit Grover search through the emulated hardware path"""
+    from qiskit import transpile
+
+    from quantum_sudoku_decrypt import grover_circuit
+
+    n, secret, shots = 4, 10, 2048
+    qc = grover_circuit(n, secret)
+
+    service = FakeRuntimeService(queue_seconds=1.0, seed=1)
+    backend = service.least_busy(operational=True, simulator=False)
+
+    print("="*70)
+    print(f"HARDWARE EMULATION ({backend.name}, {backend.num_qubits} qubits)")
+    print("="*70)
+
+    tqc = transpile(qc, backend, optimization_level=3, seed_transpiler=1)
+    print(f"  Transpiled depth: {tqc.depth()}, 2-qubit gates: "
+          f"{sum(v for k, v in tqc.count_ops().items() if k in ('cz', 'ecr', 'cx'))}")
+
+    start = time.time()
+    job = sampler_for(backend).run([tqc], shots=shots)
+    print(f"  Job ID: {job.job_id()} ({job.status().name})")
+    counts = job.result()[0].data.c.get_counts()
+    print(f"  Turnaround: {time.time() - start:.1f}s")
+
+    target = format(secret, f'0{n}b')
+    print(f"  Success probability: {counts.get(target, 0) / shots * 100:.1f}% "
+          f"(ideal {np.sin(7 * np.arcsin(0.25))**2 * 100:.1f}%)")
+
+if __name__ == "__main__":
+    main()
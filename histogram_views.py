@@ -0,0 +1,158 @@
+"""
+Aggregated Histogram Views for Large Outcome Spaces
+Reduces counts over 2^n outcomes to a bounded number of bars (by Hamming
+weight, top-k plus "other", or marginals on chosen qubits) before printing or
+plotting, instead of drawing one bar per observed bitstring
+"""
+
+import numpy as np
+
+OTHER = "other"
+
+def _normalize(data, num_bits=None):
+    """
+    Converts shot data into (bit matrix, weights).
+
+    Accepts a counts dict (bitstring or int keys), a dense integer counts
+    array indexed by outcome (length 2^n), or an (outcomes, counts) pair of
+    integer arrays. Column j of the bit matrix is the j-th character of the
+    bitstring, i.e. qubit n-1-j, as in Qiskit's counts keys.
+    """
+    if isinstance(data, dict):
+        keys = list(data)
+        weights = np.fromiter(data.values(), dtype=np.int64, count=len(keys))
+        if keys and isinstance(keys[0], str):
+            keys = [k.replace(' ', '') for k in keys]
+            num_bits = num_bits or len(keys[0])
+            bits = (np.frombuffer(''.join(keys).encode('ascii'), dtype=np.uint8)
+                    .reshape(len(keys), num_bits) - ord('0'))
+            return bits, weights
+        outcomes = np.asarray(keys, dtype=np.uint64)
+    elif isinstance(data, tuple):
+        outcomes = np.asarray(data[0], dtype=np.uint64)
+        weights = np.asarray(data[1], dtype=np.int64)
+    else:
+        dense = np.asarray(data)
+        outcomes = np.flatnonzero(dense).astype(np.uint64)
+        weights = dense[outcomes.astype(np.int64)].astype(np.int64)
+        num_bits = num_bits or max(1, int(np.log2(len(dense))))
+
+    if num_bits is None:
+        num_bits = max(1, int(outcomes.max()).bit_length()) if len(outcomes) else 1
+    shifts = np.arange(num_bits - 1, -1, -1, dtype=np.uint64)
+    bits = ((outcomes[:, None] >> shifts) & np.uint64(1)).astype(np.uint8)
+    return bits, weights
+
+def _group(bits, weights):
+    """Merges duplicate rows, returning (unique bit rows, summed weights)"""
+    packed = np.packbits(bits, axis=1)
+    unique, inverse = np.unique(packed, axis=0, return_inverse=True)
+    totals = np.bincount(inverse.ravel(), weights=weights, minlength=len(unique))
+    return np.unpackbits(unique, axis=1, count=bits.shape[1]), totals.astype(np.int64)
+
+def _to_key(row):
+    return ''.join('1' if b else '0' for b in row)
+
+def hamming_weight_view(data, num_bits=None):
+    """Counts per Hamming weight: n+1 bars for an n-bit outcome space"""
+    bits, weights = _normalize(data, num_bits)
+    hamming = bits.sum(axis=1)
+    totals = np.bincount(hamming, weights=weights, minlength=bits.shape[1] + 1)
+    return {w: int(c) for w, c in enumerate(totals)}
+
+def top_k_view(data, k=16, num_bits=None):
+    """The k most frequent outcomes plus an 'other' bucket for the rest"""
+    bits, weights = _group(*_normalize(data, num_bits))
+    k = min(k, len(weights))
+    top = np.argpartition(-weights, k - 1)[:k] if k else np.array([], dtype=np.int64)
+    top = top[np.argsort(-weights[top], kind='stable')]
+
+    view = {_to_key(bits[i]): int(weights[i]) for i in top}
+    rest = int(weights.sum() - weights[top].sum())
+    if rest:
+        view[OTHER] = rest
+    return view
+
+def marginal_view(data, qubits, num_bits=None):
+    """
+    Counts marginalized onto the given qubits (Qiskit qubit indices, key
+    characters ordered from the highest requested qubit to the lowest, as in
+    marginal_counts).
+    """
+    bits, weights = _normalize(data, num_bits)
+    n = bits.shape[1]
+    columns = [n - 1 - q for q in sorted(qubits, reverse=True)]
+    marginal, totals = _group(bits[:, columns], weights)
+    return {_to_key(row): int(c) for row, c in zip(marginal, totals)}
+
+def bound_view(view, max_bars=32):
+    """
+    Limits a view to max_bars bars: ordered integer keys (Hamming weights)
+    are merged into contiguous ranges, other keys keep the largest bars and
+    fold the rest into 'other'.
+    """
+    if len(view) <= max_bars:
+        return view
+    if all(isinstance(k, (int, np.integer)) for k in view):
+        keys = sorted(view)
+        edges = np.linspace(0, len(keys), max_bars + 1).astype(int)
+        binned = {}
+        for lo, hi in zip(edges[:-1], edges[1:]):
+            if hi > lo:
+                label = f"{keys[lo]}-{keys[hi - 1]}" if hi - lo > 1 else keys[lo]
+                binned[label] = sum(view[k] for k in keys[lo:hi])
+        return binned
+    items = [(k, v) for k, v in view.items() if k != OTHER]
+    items.sort(key=lambda x: x[1], reverse=True)
+    kept = dict(items[:max_bars - 1])
+    kept[OTHER] = sum(view.values()) - sum(kept.values())
+    return kept
+
+def print_view(view, title="Outcome histogram", max_bars=32, width=40):
+    """Prints a view as a compact text histogram"""
+    view = bound_view(view, max_bars)
+    total = sum(view.values()) or 1
+    peak = max(view.values()) or 1
+    print(f"\n{title}:")
+    for key, count in view.items():
+        bar = '█' * int(count / peak * width)
+        print(f"  {str(key):>12}: {count:7d} ({count / total * 100:5.1f}%) {bar}")
+
+def plot_view(view, title=None, ax=None, max_bars=32):
+    """Bar chart of a view with a bounded number of bars (needs matplotlib)"""
+    import matplotlib.pyplot as plt
+
+    view = bound_view(view, max_bars)
+    if ax is None:
+        _, ax = plt.subplots(figsize=(min(2 + 0.4 * len(view), 16), 5))
+    labels = [str(k) for k in view]
+    ax.bar(range(len(view)), list(view.values()), color='#32a8a4')
+    ax.set_xticks(range(len(view)))
+    ax.set_xticklabels(labels, rotation=60 if len(labels) > 8 else 0, ha='right')
+    ax.set_ylabel("Counts")
+    if title:
+        ax.set_title(title)
+    return ax
+
+def main():
+    """Aggregates a synthetic noisy 20-qubit GHZ run (10,000 shots)"""
+    rng = np.random.default_rng(0)
+    n, shots = 20, 10000
+
+    # Ideal all-zeros/all-ones outcomes with independent bit flips
+    ideal = np.repeat(rng.integers(0, 2, size=(shots, 1)), n, axis=1)
+    flips = rng.random((shots, n)) < 0.02
+    noisy = (ideal ^ flips).astype(np.uint8)
+    outcomes = (noisy.astype(np.uint64) << np.arange(n - 1, -1, -1, dtype=np.uint64)).sum(axis=1)
+    dense = np.bincount(outcomes.astype(np.int64), minlength=2**n)
+
+    print("="*70)
+    print(f"HISTOGRAM VIEWS ({n} qubits, {shots} shots, "
+          f"{np.count_nonzero(dense)} distinct outcomes)")
+    print("="*70)
+    print_view(hamming_weight_view(dense), "By Hamming weight")
+    print_view(top_k_view(dense, k=8), "Top 8 + other")
+    print_view(marginal_view(dense, [0, 1, 2]), "Marginal on qubits 0-2")
+
+if __name__ == "__main__":
+    main()
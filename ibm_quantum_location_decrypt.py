@@ -4,8 +4,8 @@ Uses 100+ qubit IBM Quantum computer to decrypt AES-encrypted Sudoku data
 from the Sudoku database using Grover's algorithm
 """
 
-from qiskit_ibm_runtime import QiskitRuntimeService, Sampler, Options
-from qiskit import QuantumCircuit, transpile
+from qiskit_ibm_runtime import QiskitRuntimeService, Options
+from qiskit import QuantumCircuit
 from qiskit_aer import AerSimulator
 import numpy as np
 import math
@@ -17,10 +17,21 @@ import struct
 
 from Crypto.Cipher import AES
 
+from adaptive_shots import run_adaptive
+from grover_peephole import push_pauli_frames
+from hardware_emulation import FakeRuntimeService, sampler_for
+from histogram_views import OTHER, top_k_view
+from readout_mitigation import ReadoutMitigator, mitigated_counts
+from transpile_cache import TranspileCache, cached_transpile
+
 # Configuration
 USE_IBM_HARDWARE = True  # Set to True to use real IBM Quantum hardware
 MAX_QUBITS = 156  # Available qubits on IBM hardware (ibm_fez)
 TIME_LIMIT = 600  # 10 minutes in seconds
+MITIGATE_READOUT = False  # Correct hardware counts for readout error
+EMULATE_HARDWARE = False  # Run the hardware path on a local fake backend (FakeFez) with noise
+ADAPTIVE_SHOTS = False  # Stop sampling once the leading key is statistically separated
+HARDWARE_BATCH_SHOTS = 256  # Shots per hardware job in adaptive mode (each job queues)
 
 def extract_encrypted_sudoku():
     """Extract encrypted Sudoku data from Sudoku database"""
@@ -129,7 +140,51 @@ def create_diffuser(n_qubits):
     
     return qc.to_gate(label=f"Diffuser_{n_qubits}q")
 
-def quantum_key_search(encrypted_data, n_qubits=16, use_ibm=True):
+def grover_iteration_plan(n_qubits):
+    """
+    Iteration count quantum_key_search reports and the capped count it runs.
+
+    Returns:
+        (optimal iterations, iterations actually applied)
+    """
+    # Calculate optimal iterations
+    # For large n_qubits, use logarithmic approximation to avoid overflow
+    if n_qubits > 50:
+        # For very large search spaces, use a fixed small number of iterations
+        iterations = 2
+    else:
+        iterations = max(1, int(np.floor((np.pi/4) * np.sqrt(2**n_qubits))))
+
+    # For large circuits, use a practical number of iterations
+    # More iterations = better chance, but circuit becomes too deep
+    if n_qubits > 100:
+        max_iterations = min(iterations, 3)  # 3 iterations for 100+ qubits
+    elif n_qubits > 50:
+        max_iterations = min(iterations, 5)  # 5 iterations for 50-100 qubits
+    elif n_qubits > 30:
+        max_iterations = min(iterations, 100)  # 100 iterations for 30-50 qubits
+    else:
+        max_iterations = min(iterations, 1000)  # 1000 iterations for smaller circuits
+    return iterations, max_iterations
+
+def sampler_result_counts(result, register, n_qubits, shots):
+    """
+    Counts dictionary from a Sampler result: V2 pub results hold one
+    BitArray per classical register, read by name; V1 quasi-distributions
+    are scaled back to shots.
+    """
+    if hasattr(result, 'quasi_dists'):
+        counts = result.quasi_dists[0]
+        return {format(k, f'0{n_qubits}b'): int(v * shots) for k, v in counts.items()}
+    data = result[0].data
+    try:
+        return data[register].get_counts()
+    except (AttributeError, KeyError):
+        raise ValueError(f"Sampler result has no classical register '{register}' "
+                         f"(registers: {list(data.keys())})") from None
+
+def quantum_key_search(encrypted_data, n_qubits=16, use_ibm=True, mitigate=False,
+                       adaptive=False, transpile_cache=None, emulate=False):
     """
     Uses Grover's algorithm to search for AES decryption key for Sudoku data.
     
@@ -137,18 +192,20 @@ def quantum_key_search(encrypted_data, n_qubits=16, use_ibm=True):
         encrypted_data: The encrypted Sudoku bytes
         n_qubits: Number of qubits to use (up to 100 on IBM hardware)
         use_ibm: Whether to use IBM Quantum hardware
+        mitigate: Correct hardware counts for readout error using a
+            tensored calibration (cached per backend calibration)
+        adaptive: Sample in batches (HARDWARE_BATCH_SHOTS per hardware job)
+            and stop once the leading key is separated from the runner-up
+        transpile_cache: Optional TranspileCache shared across records and
+            processes
+        emulate: Run the hardware path offline on a fake backend with its
+            noise model and a simulated queue (see hardware_emulation)
     """
     # Create hash of encrypted data to search for
     data_hash = int(hashlib.sha256(encrypted_data).hexdigest()[:16], 16)
     target = data_hash % (2**n_qubits)
     
-    # Calculate optimal iterations
-    # For large n_qubits, use logarithmic approximation to avoid overflow
-    if n_qubits > 50:
-        # For very large search spaces, use a fixed small number of iterations
-        iterations = 2
-    else:
-        iterations = max(1, int(np.floor((np.pi/4) * np.sqrt(2**n_qubits))))
+    iterations, max_iterations = grover_iteration_plan(n_qubits)
     
     print(f"\n{'='*70}")
     print(f"QUANTUM KEY SEARCH")
@@ -157,7 +214,7 @@ def quantum_key_search(encrypted_data, n_qubits=16, use_ibm=True):
     print(f"  Search space: {2**n_qubits:,} possible keys")
     print(f"  Target hash: {target}")
     print(f"  Optimal iterations: {iterations:,}")
-    print(f"  Backend: {'IBM Quantum Hardware' if use_ibm else 'Local Simulator'}")
+    print(f"  Backend: {('Emulated IBM Quantum Hardware' if emulate else 'IBM Quantum Hardware') if use_ibm else 'Local Simulator'}")
     
     # Build quantum circuit
     qc = QuantumCircuit(n_qubits, n_qubits)
@@ -169,16 +226,6 @@ def quantum_key_search(encrypted_data, n_qubits=16, use_ibm=True):
     oracle = create_aes_oracle(n_qubits, target)
     diff = create_diffuser(n_qubits)
     
-    # For large circuits, use a practical number of iterations
-    # More iterations = better chance, but circuit becomes too deep
-    if n_qubits > 100:
-        max_iterations = min(iterations, 3)  # 3 iterations for 100+ qubits
-    elif n_qubits > 50:
-        max_iterations = min(iterations, 5)  # 5 iterations for 50-100 qubits
-    elif n_qubits > 30:
-        max_iterations = min(iterations, 100)  # 100 iterations for 30-50 qubits
-    else:
-        max_iterations = min(iterations, 1000)  # 1000 iterations for smaller circuits
     for i in range(max_iterations):
         qc.append(oracle, range(n_qubits))
         qc.append(diff, range(n_qubits))
@@ -191,7 +238,7 @@ def quantum_key_search(encrypted_data, n_qubits=16, use_ibm=True):
     if use_ibm:
         try:
             print("\n  Connecting to IBM Quantum...")
-            service = QiskitRuntimeService()
+            service = FakeRuntimeService() if emulate else QiskitRuntimeService()
             
             # Get available backends
             backends = service.backends(operational=True, simulator=False)
@@ -213,72 +260,53 @@ def quantum_key_search(encrypted_data, n_qubits=16, use_ibm=True):
                 
                 # Optimize circuit for hardware
                 print("  Transpiling circuit for hardware...")
-                tqc = transpile(qc, backend, optimization_level=3)
+                # Collapse the per-iteration X masks before the general transpiler
+                tqc = cached_transpile(push_pauli_frames(qc), backend, transpile_cache,
+                                       optimization_level=3)
                 print(f"  Circuit depth: {tqc.depth()}")
                 print(f"  Circuit gates: {tqc.count_ops()}")
                 
                 # Submit job using Sampler primitive
                 print("  Submitting job to IBM Quantum...")
-                sampler = Sampler(backend)
-                job = sampler.run([tqc], shots=1024)
-                print(f"  Job ID: {job.job_id()}")
-                print("  Waiting for results (this may take several minutes)...")
+                sampler = sampler_for(backend)
+
+                def run_batch(batch_shots):
+                    job = sampler.run([tqc], shots=batch_shots)
+                    print(f"  Job ID: {job.job_id()}")
+                    print("  Waiting for results (this may take several minutes)...")
+                    return sampler_result_counts(job.result(), tqc.cregs[0].name,
+                                                 n_qubits, batch_shots)
 
-                result = job.result()
-                # Handle different result formats from Sampler
                 try:
-                    # Try new format (SamplerResult)
-                    if hasattr(result, 'quasi_dists'):
-                        counts = result.quasi_dists[0]
-                        counts = {format(k, f'0{n_qubits}b'): int(v * 1024) for k, v in counts.items()}
+                    if adaptive:
+                        # Every batch is a queued job, so batches are larger
+                        # than on the simulator
+                        counts, used, _ = run_adaptive(run_batch, max_shots=1024,
+                                                       batch_shots=HARDWARE_BATCH_SHOTS)
+                        print(f"  Adaptive mode used {used}/1024 shots")
                     else:
-                        # New format: result[0].data contains BitArray
-                        pub_result = result[0]
-                        # Get the classical register data (BitArray)
-                        # Try different attribute names for the measurement results
-                        if hasattr(pub_result.data, 'c'):
-                            bit_array = pub_result.data.c
-                        elif hasattr(pub_result.data, 'cr'):
-                            bit_array = pub_result.data.cr
-                        elif hasattr(pub_result.data, 'meas'):
-                            bit_array = pub_result.data.meas
-                        else:
-                            # Get first attribute that looks like measurement data
-                            data_attrs = [attr for attr in dir(pub_result.data) if not attr.startswith('_')]
-                            bit_array = getattr(pub_result.data, data_attrs[0])
-                        
-                        # Convert BitArray to counts dictionary
-                        counts = {}
-                        # BitArray can be iterated directly or accessed via array
-                        try:
-                            # Try to get the underlying array
-                            if hasattr(bit_array, 'array'):
-                                arr = bit_array.array
-                            else:
-                                arr = bit_array
-                            
-                            # Convert each measurement to binary string
-                            for measurement in arr:
-                                # Handle different array formats
-                                if hasattr(measurement, '__iter__') and not isinstance(measurement, (int, str)):
-                                    key = ''.join(str(int(b)) for b in measurement)
-                                else:
-                                    key = format(int(measurement), f'0{n_qubits}b')
-                                counts[key] = counts.get(key, 0) + 1
-                        except:
-                            # Fallback: try to convert BitArray directly
-                            for i in range(len(bit_array)):
-                                val = bit_array[i]
-                                key = format(int(val), f'0{n_qubits}b')
-                                counts[key] = counts.get(key, 0) + 1
+                        counts = run_batch(1024)
                 except Exception as e:
-                    print(f"  Error parsing results: {e}")
+                    print(f"  Error retrieving results: {e}")
                     print("  Falling back to local simulator...")
                     use_ibm = False
                 
                 if use_ibm:
                     print("  ✓ Results received from IBM Quantum!")
                 
+                if use_ibm and mitigate:
+                    print("  Applying readout-error mitigation...")
+                    # A failed calibration keeps the raw hardware counts
+                    # rather than discarding them for the simulator
+                    try:
+                        physical_qubits = tqc.layout.final_index_layout()[:n_qubits]
+                        mitigator = ReadoutMitigator.calibrate(
+                            backend, n_qubits, physical_qubits=physical_qubits
+                        )
+                        counts = mitigated_counts(mitigator.apply(counts), sum(counts.values()))
+                    except Exception as e:
+                        print(f"  Readout mitigation failed ({e}), using raw counts")
+                
         except Exception as e:
             print(f"  IBM Quantum error: {e}")
             print("  Falling back to local simulator...")
@@ -287,9 +315,16 @@ def quantum_key_search(encrypted_data, n_qubits=16, use_ibm=True):
     if not use_ibm:
         print("\n  Using local AerSimulator...")
         simulator = AerSimulator()
-        tqc = transpile(qc, simulator)
-        job = simulator.run(tqc, shots=2048)
-        counts = job.result().get_counts()
+        tqc = cached_transpile(qc, simulator, transpile_cache)
+        if adaptive:
+            counts, used, _ = run_adaptive(
+                lambda batch_shots: simulator.run(tqc, shots=batch_shots).result().get_counts(),
+                max_shots=2048,
+            )
+            print(f"  Adaptive mode used {used}/2048 shots")
+        else:
+            job = simulator.run(tqc, shots=2048)
+            counts = job.result().get_counts()
         print("  ✓ Simulation complete!")
     
     # Analyze results
@@ -297,37 +332,34 @@ def quantum_key_search(encrypted_data, n_qubits=16, use_ibm=True):
     print("RESULTS")
     print(f"{'─'*70}")
     
-    sorted_counts = sorted(counts.items(), key=lambda x: x[1], reverse=True)
+    # Top 5 plus an 'other' bucket; keys come back as n-bit binary strings
+    # whether the counts were keyed by bitstring or by integer
+    top = top_k_view(counts, k=5, num_bits=n_qubits)
+    total = sum(counts.values())
     
     print("\nTop 5 most probable keys:")
-    for i, (state, count) in enumerate(sorted_counts[:5], 1):
-        probability = count / sum(counts.values()) * 100
-        # Handle both binary string and decimal formats
-        if isinstance(state, str) and all(c in '01' for c in state):
-            decimal = int(state, 2)
-            binary_str = state
-        else:
-            decimal = int(state) if not isinstance(state, int) else state
-            binary_str = format(decimal, f'0{n_qubits}b')
-        print(f"  {i}. Key: {decimal:6d} (binary: {binary_str}) - {probability:5.1f}% ({count} shots)")
+    for i, (state, count) in enumerate(top.items(), 1):
+        probability = count / total * 100
+        if state == OTHER:
+            print(f"     Other keys: {probability:5.1f}% ({count} shots)")
+            continue
+        print(f"  {i}. Key: {int(state, 2):6d} (binary: {state}) - {probability:5.1f}% ({count} shots)")
     
     # Get most probable key
-    most_probable_state = sorted_counts[0][0]
-    # Handle both binary string and decimal formats
-    if isinstance(most_probable_state, str) and all(c in '01' for c in most_probable_state):
-        most_probable_key = int(most_probable_state, 2)
-    else:
-        most_probable_key = int(most_probable_state) if not isinstance(most_probable_state, int) else most_probable_state
-    confidence = sorted_counts[0][1] / sum(counts.values()) * 100
+    most_probable_state, most_probable_count = next(iter(top.items()))
+    most_probable_key = int(most_probable_state, 2)
+    confidence = most_probable_count / total * 100
     
     print(f"\n✓ Most probable decryption key: {most_probable_key}")
     print(f"  Confidence: {confidence:.1f}%")
     
     return most_probable_key, confidence
 
-def decrypt_location_data(encrypted_locations, use_ibm=True):
+def decrypt_location_data(encrypted_locations, use_ibm=True, mitigate=False, emulate=False,
+                          adaptive=False):
     """
-    Main decryption function for location data using IBM Quantum hardware.
+    Main decryption function for location data using IBM Quantum hardware
+    (or its offline emulation when emulate is set).
     """
     print("\n" + "█"*70)
     print("IBM QUANTUM SUDOKU DECRYPTION")
@@ -341,6 +373,8 @@ def decrypt_location_data(encrypted_locations, use_ibm=True):
 
     # For each encrypted location, use quantum search
     decrypted_results = []
+    # Transpiled circuits persist on disk, so re-runs skip the transpiler
+    transpile_cache = TranspileCache()
 
     for i, sudoku_data in enumerate(encrypted_locations[:3], 1):  # Process first 3 for demo
         print(f"\n{'█'*70}")
@@ -359,7 +393,11 @@ def decrypt_location_data(encrypted_locations, use_ibm=True):
         key, confidence = quantum_key_search(
             sudoku_data['base64_bytes'],
             n_qubits=n_qubits,
-            use_ibm=use_ibm
+            use_ibm=use_ibm,
+            mitigate=mitigate,
+            adaptive=adaptive,
+            transpile_cache=transpile_cache,
+            emulate=emulate
         )
         
         # Decrypt location data using AES
@@ -410,6 +448,7 @@ def decrypt_location_data(encrypted_locations, use_ibm=True):
         print(result['location'])
         print(f"  Confidence: {confidence:.1f}%")
     
+    transpile_cache.report()
     return decrypted_results
 
 def save_sudoku_results(results):
@@ -451,7 +490,9 @@ def main():
     print(f"Time limit: {TIME_LIMIT} seconds (10 minutes)")
     print(f"Algorithm: Grover's Search")
     
-    results = decrypt_location_data(encrypted_sudoku, use_ibm=USE_IBM_HARDWARE)
+    results = decrypt_location_data(encrypted_sudoku, use_ibm=USE_IBM_HARDWARE,
+                                    mitigate=MITIGATE_READOUT, emulate=EMULATE_HARDWARE,
+                                    adaptive=ADAPTIVE_SHOTS)
     
     # Step 3: Save results
     if results:
@@ -0,0 +1,120 @@
+"""
+Partitioned Parallel Grover Search
+Splits a 2^n search space into 2^m classical partitions, each searched by an
+(n-m)-qubit Grover instance in its own worker process, then checks which
+partition produced a marked hit and compares oracle queries with the
+monolithic search
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+import time
+
+import numpy as np
+
+from grover_simulator import (_normalize_marked, apply_grover_iteration,
+                              initial_state, optimal_iterations, sample_counts)
+
+def search_partition(n, m, partition, marked, shots=256, seed=None):
+    """
+    Runs the (n-m)-qubit Grover instance for one partition.
+
+    The partition fixes the top m bits of the index; the local oracle marks
+    only the elements of `marked` inside it. A worker does not know whether
+    its partition holds a solution, so it always runs the optimal count for
+    one marked element and verifies its best candidate with one extra
+    classical oracle query.
+
+    Returns:
+        Dictionary with 'partition', 'candidate' (global index), 'hit',
+        'queries' (Grover iterations), 'verifications' and 'seconds'
+    """
+    start = time.time()
+    local_n = n - m
+    offset = partition << local_n
+    local_marked = [x - offset for x in marked if x >> local_n == partition]
+
+    iterations = optimal_iterations(local_n)
+    amplitudes = initial_state(local_n)
+    for _ in range(iterations):
+        apply_grover_iteration(amplitudes, local_marked)
+
+    rng = np.random.default_rng(seed)
+    counts = sample_counts(amplitudes**2, shots, rng, local_n)
+    candidate = offset + int(max(counts.items(), key=lambda x: x[1])[0], 2)
+
+    return {
+        'partition': partition,
+        'candidate': candidate,
+        'hit': candidate in marked,  # the verification query
+        'queries': iterations,
+        'verifications': 1,
+        'seconds': time.time() - start,
+    }
+
+def partitioned_search(n, marked, m, shots=256, workers=None, seed=None):
+    """
+    Searches 2^n elements as 2^m parallel (n-m)-qubit Grover instances.
+
+    Args:
+        n: Total number of index bits
+        marked: Target value or iterable of target values
+        m: Number of index bits split off classically (0 = monolithic)
+        shots: Shots per partition
+        workers: Worker processes (default: os.cpu_count())
+        seed: Base seed; partition i uses seed + i
+
+    Returns:
+        Dictionary with the per-partition 'results', the 'hits', total
+        Grover oracle 'queries', the 'parallel_queries' on the critical path
+        and the 'monolithic_queries' of a single n-qubit search. Classical
+        verification queries are reported separately ('verifications',
+        one per partition, against 'monolithic_verifications' = 1) so both
+        sides of the comparison count the same kind of query.
+    """
+    marked = _normalize_marked(n, marked)
+    if not 0 <= m < n:
+        raise ValueError(f"Need 0 <= m < n, got m={m}, n={n}")
+
+    partitions = range(2**m)
+    seeds = [None if seed is None else seed + p for p in partitions]
+    start = time.time()
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = [pool.submit(search_partition, n, m, p, marked, shots, s)
+                   for p, s in zip(partitions, seeds)]
+        results = [f.result() for f in futures]
+
+    queries = sum(r['queries'] for r in results)
+    return {
+        'n': n,
+        'm': m,
+        'results': results,
+        'hits': [r['candidate'] for r in results if r['hit']],
+        'queries': queries,
+        'parallel_queries': max(r['queries'] for r in results),
+        'monolithic_queries': optimal_iterations(n, len(marked)),
+        'verifications': sum(r['verifications'] for r in results),
+        'monolithic_verifications': 1,
+        'seconds': time.time() - start,
+    }
+
+def main():
+    """Parallelism vs. query-count tradeoff for a 20-qubit search"""
+    n, secret = 20, 314_159
+
+    print("="*70)
+    print(f"PARTITIONED GROVER SEARCH ({n} qubits, target {secret})")
+    print("="*70)
+    print(f"  {'m':>2} {'parts':>6} {'local n':>8} {'total':>9} {'critical':>9} "
+          f"{'monolithic':>11} {'verify':>7} {'time':>8}  hits")
+
+    for m in range(0, 5):
+        result = partitioned_search(n, secret, m, seed=1)
+        print(f"  {m:2d} {2**m:6d} {n - m:8d} {result['queries']:9d} "
+              f"{result['parallel_queries']:9d} {result['monolithic_queries']:11d} "
+              f"{result['verifications']:7d} {result['seconds']:7.2f}s  {result['hits']}")
+
+    print("\n  total grows ~sqrt(2^m) while the critical path shrinks ~1/sqrt(2^m)")
+
+if __name__ == "__main__":
+    main()
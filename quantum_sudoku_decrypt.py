@@ -4,13 +4,21 @@ This script uses Grover's algorithm to search for location data hidden in Sudoku
 """
 
 from qiskit_ibm_runtime import QiskitRuntimeService
-from qiskit import QuantumCircuit, transpile
+from qiskit import QuantumCircuit
 from qiskit_aer import AerSimulator
 import numpy as np
+import itertools
 import math
 import sqlite3
 from pathlib import Path
 
+from adaptive_shots import run_adaptive
+from hardware_emulation import FakeRuntimeService, sampler_for
+from histogram_views import OTHER, top_k_view
+from partial_search import plan_partial_search, simulate_partial_search, target_block
+from result_cache import ResultCache, circuit_fingerprint, make_cache_key
+from transpile_cache import cached_transpile
+
 # Database files
 DB_FILES = ['sudoku_database', 'sudoku_database-shm', 'sudoku_database-wal']
 
@@ -90,15 +98,46 @@ def diffuser(n):
     
     return qc.to_gate(label="Diffuser")
 
-def run_grover_search(secret, n=4, shots=1024, use_ibm=False):
+def grover_circuit(n, secret, iterations=None, measure=True):
+    """
+    Builds the Grover search circuit: uniform superposition, then
+    Oracle + Diffuser per iteration, then measurement of every qubit.
+
+    Args:
+        n: Number of qubits
+        secret: The target value (0 to 2^n - 1)
+        iterations: Grover iterations (default: floor((pi/4) * sqrt(2^n)))
+        measure: Add classical bits and measure into them
+    """
+    if iterations is None:
+        iterations = int(np.floor((np.pi/4) * np.sqrt(2**n)))
+    qc = QuantumCircuit(n, n) if measure else QuantumCircuit(n)
+    qc.h(range(n))
+    for _ in range(iterations):
+        qc.append(make_oracle(n, secret), range(n))
+        qc.append(diffuser(n), range(n))
+    if measure:
+        qc.measure(range(n), range(n))
+    return qc
+
+def run_grover_search(secret, n=4, shots=1024, use_ibm=False, cache=None, seed=None,
+                      adaptive=False, transpile_cache=None, emulate=False):
     """
     Runs Grover's algorithm to find the secret value.
     
     Args:
         secret: The target value to find (0 to 2^n - 1)
         n: Number of qubits (search space size is 2^n)
-        shots: Number of measurements
+        shots: Number of measurements (the shot budget when adaptive)
         use_ibm: Whether to use IBM Quantum hardware
+        cache: Optional ResultCache for local simulator runs; only seeded
+            runs are cached, since an unseeded run is a fresh sample
+        seed: Simulator seed (part of the cache key)
+        adaptive: Run in small batches and stop once the leading outcome is
+            separated from the runner-up (see adaptive_shots.run_adaptive)
+        transpile_cache: Optional TranspileCache for the transpiled circuits
+        emulate: Run the hardware path offline on a fake backend with its
+            noise model and a simulated queue (see hardware_emulation)
     """
     # Calculate optimal number of iterations
     iterations = int(np.floor((np.pi/4) * np.sqrt(2**n)))
@@ -112,30 +151,30 @@ def run_grover_search(secret, n=4, shots=1024, use_ibm=False):
     print(f"{'='*60}\n")
     
     # Build the quantum circuit
-    qc = QuantumCircuit(n, n)
-    
-    # Initialize superposition
-    qc.h(range(n))
-    
-    # Apply Grover iterations
-    for i in range(iterations):
-        qc.append(make_oracle(n, secret), range(n))
-        qc.append(diffuser(n), range(n))
-    
-    # Measure
-    qc.measure(range(n), range(n))
+    qc = grover_circuit(n, secret, iterations)
     
     # Execute the circuit
     if use_ibm:
         try:
-            service = QiskitRuntimeService()
+            service = FakeRuntimeService() if emulate else QiskitRuntimeService()
             backend = service.least_busy(operational=True, simulator=False)
-            print(f"Using IBM Quantum backend: {backend.name}")
-            job = backend.run(qc, shots=shots)
-            print(f"Job ID: {job.job_id()}")
-            print("Waiting for results...")
-            result = job.result()
-            counts = result.get_counts()
+            print(f"Using IBM Quantum backend: {backend.name}{' (emulated)' if emulate else ''}")
+            # Hardware only accepts circuits in its native gates and layout
+            tqc = cached_transpile(qc, backend, transpile_cache, optimization_level=3)
+            
+            sampler = sampler_for(backend)
+            
+            def run_batch(batch_shots):
+                job = sampler.run([tqc], shots=batch_shots)
+                print(f"Job ID: {job.job_id()}")
+                print("Waiting for results...")
+                return job.result()[0].data.c.get_counts()
+            
+            if adaptive:
+                counts, used, _ = run_adaptive(run_batch, max_shots=shots)
+                print(f"Adaptive mode used {used}/{shots} shots")
+            else:
+                counts = run_batch(shots)
         except Exception as e:
             print(f"IBM Quantum error: {e}")
             print("Falling back to local simulator...")
@@ -144,15 +183,37 @@ def run_grover_search(secret, n=4, shots=1024, use_ibm=False):
     if not use_ibm:
         # Use local Aer simulator
         simulator = AerSimulator()
-        tqc = transpile(qc, simulator)
-        job = simulator.run(tqc, shots=shots)
-        counts = job.result().get_counts()
+
+        def execute():
+            tqc = cached_transpile(qc, simulator, transpile_cache)
+            if not adaptive:
+                job = simulator.run(tqc, shots=shots, seed_simulator=seed)
+                return job.result().get_counts()
+            batch_seeds = itertools.count(seed) if seed is not None else itertools.repeat(None)
+            counts, used, _ = run_adaptive(
+                lambda batch_shots: simulator.run(
+                    tqc, shots=batch_shots, seed_simulator=next(batch_seeds)
+                ).result().get_counts(),
+                max_shots=shots,
+            )
+            print(f"Adaptive mode used {used}/{shots} shots")
+            return counts
+
+        if cache is not None and seed is not None:
+            budget = f"adaptive:{shots}" if adaptive else shots
+            key = make_cache_key(circuit_fingerprint(qc), simulator.name, budget, seed)
+            counts = cache.run(key, execute)
+        else:
+            counts = execute()
     
     # Analyze results
+    shots = sum(counts.values())
     print("\nMeasurement Results:")
-    sorted_counts = sorted(counts.items(), key=lambda x: x[1], reverse=True)
-    for state, count in sorted_counts[:5]:  # Show top 5 results
+    for state, count in top_k_view(counts, k=5).items():  # Top 5, the rest as 'other'
         probability = count / shots * 100
+        if state == OTHER:
+            print(f"  Other states: {count} times ({probability:.1f}%)")
+            continue
         decimal = int(state, 2)
         print(f"  State |{state}> (decimal {decimal}): {count} times ({probability:.1f}%)")
     
@@ -165,6 +226,94 @@ def run_grover_search(secret, n=4, shots=1024, use_ibm=False):
     
     return found_value, counts
 
+def partial_search_circuit(n, m, secret, global_iterations, local_iterations):
+    """
+    Gate-level partial search for the leading m bits of the secret.
+    Local iterations use the diffuser on the lower n-m qubits only, which
+    inverts about the mean inside every block at once; only the m block
+    qubits are measured.
+    """
+    qc = QuantumCircuit(n, m)
+    qc.h(range(n))
+    for _ in range(global_iterations):
+        qc.append(make_oracle(n, secret), range(n))
+        qc.append(diffuser(n), range(n))
+    for _ in range(local_iterations):
+        qc.append(make_oracle(n, secret), range(n))
+        qc.append(diffuser(n - m), range(n - m))
+    qc.append(make_oracle(n, secret), range(n))
+    qc.append(diffuser(n), range(n))
+    qc.measure(range(n - m, n), range(m))
+    return qc
+
+def run_partial_search(secret, n=4, m=1, shots=1024, engine='aer', use_ibm=False,
+                       emulate=False, seed=None, transpile_cache=None):
+    """
+    Finds the first m bits of the secret (its block of 2^(n-m) values) with
+    fewer oracle queries than run_grover_search needs for the whole value.
+
+    Args:
+        secret: The target value (0 to 2^n - 1)
+        n: Number of qubits (search space size is 2^n)
+        m: Number of leading bits to find (1 <= m < n)
+        shots: Number of measurements
+        engine: 'aer' (gate-level circuit), or the fast 'numpy' / 'batched'
+            engines from partial_search
+        use_ibm: Whether to run the gate-level circuit on IBM Quantum hardware
+        emulate: Run the hardware path on a local fake backend
+        seed: Simulator / sampling seed
+        transpile_cache: Optional TranspileCache for the transpiled circuits
+
+    Returns:
+        (most probable block, counts keyed by m-bit block, plan dictionary
+        from plan_partial_search with the query counts)
+    """
+    plan = plan_partial_search(n, m)
+    block = target_block(n, m, secret)
+
+    print(f"\n{'='*60}")
+    print(f"Partial Search Parameters:")
+    print(f"  Qubits: {n} ({2**m} blocks of {2**(n - m)} states)")
+    print(f"  Target block: {block} (leading bits: {format(block, f'0{m}b')})")
+    print(f"  Iterations: {plan['global_iterations']} global + "
+          f"{plan['local_iterations']} local + 1 global")
+    print(f"  Oracle queries: {plan['queries']} vs {plan['full_queries']} for full search "
+          f"({plan['query_reduction'] * 100:.1f}% fewer)")
+    print(f"{'='*60}\n")
+
+    if engine != 'aer':
+        counts = simulate_partial_search(n, m, secret, plan, shots=shots, seed=seed, engine=engine)
+    else:
+        qc = partial_search_circuit(n, m, secret, plan['global_iterations'],
+                                    plan['local_iterations'])
+        counts = None
+        if use_ibm:
+            try:
+                service = FakeRuntimeService() if emulate else QiskitRuntimeService()
+                backend = service.least_busy(operational=True, simulator=False)
+                print(f"Using IBM Quantum backend: {backend.name}{' (emulated)' if emulate else ''}")
+                tqc = cached_transpile(qc, backend, transpile_cache, optimization_level=3)
+                job = sampler_for(backend).run([tqc], shots=shots)
+                print(f"Job ID: {job.job_id()}")
+                print("Waiting for results...")
+                counts = job.result()[0].data.c.get_counts()
+            except Exception as e:
+                print(f"IBM Quantum error: {e}")
+                print("Falling back to local simulator...")
+        if counts is None:
+            simulator = AerSimulator()
+            tqc = cached_transpile(qc, simulator, transpile_cache)
+            counts = simulator.run(tqc, shots=shots, seed_simulator=seed).result().get_counts()
+
+    shots = sum(counts.values())
+    most_probable = max(counts.items(), key=lambda x: x[1])
+    found_block = int(most_probable[0], 2)
+    print(f"✓ Most probable block: {found_block} ({most_probable[1] / shots * 100:.1f}%, "
+          f"predicted {plan['success_probability'] * 100:.1f}%)")
+    print(f"  Success: {'YES' if found_block == block else 'NO'}")
+
+    return found_block, counts, plan
+
 def extract_sudoku_data():
     """
     Extracts Sudoku puzzle data from the SQLite database.
@@ -247,11 +396,15 @@ def analyze_location_data(data):
     print("Running Grover's Algorithm to find hidden patterns...")
     print("-"*60)
     
+    # Values are reduced mod 16, so the same seeded 4-qubit experiment recurs often
+    cache = ResultCache()
     results = []
     for i, target in enumerate(numeric_values[:5]):  # Analyze first 5 values
         print(f"\n[Search {i+1}/5] Looking for value: {target}")
-        found, counts = run_grover_search(target, n=4, shots=2048)
+        found, counts = run_grover_search(target, n=4, shots=2048, cache=cache, seed=1)
         results.append((target, found, counts))
+    cache.report()
+    cache.close()
     
     # Decode potential location data
     print("\n" + "="*60)
@@ -0,0 +1,165 @@
+"""
+Content-Addressed Result Cache for Grover Experiments
+Stores measurement counts in a local SQLite file (WAL mode), keyed by a
+structural hash of the circuit or experiment spec plus backend, shots and seed
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+from qiskit.circuit import Gate, Instruction
+
+DEFAULT_CACHE_PATH = Path("grover_results.sqlite")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MB of stored counts
+
+def _instruction_fingerprint(op, digest):
+    """Feeds one operation (and, for custom gates, its body) into the hash"""
+    if type(op) in (Gate, Instruction) and op.definition is not None:
+        # Custom wrappers built with to_gate() (Oracle, Diffuser, ...) get an
+        # auto-generated unique name, so they are identified by label + body.
+        digest.update(f"custom:{op.label}{{".encode('utf-8'))
+        _circuit_fingerprint(op.definition, digest)
+        digest.update(b'}')
+        return
+    digest.update(op.name.encode('utf-8'))
+    digest.update(repr([p if isinstance(p, (int, float, complex, str)) else repr(p)
+                        for p in op.params]).encode('utf-8'))
+
+def _circuit_fingerprint(qc, digest):
+    # Register names and sizes shape the count keys ('meas' vs 'c', spaces
+    # between registers), so circuits that differ only there must not collide
+    registers = [(r.name, r.size) for r in qc.qregs] + [(r.name, r.size) for r in qc.cregs]
+    digest.update(f"q{qc.num_qubits}c{qc.num_clbits}{registers}"
+                  f"phase{qc.global_phase!r};".encode('utf-8'))
+    for instruction in qc.data:
+        _instruction_fingerprint(instruction.operation, digest)
+        qubits = [qc.find_bit(q).index for q in instruction.qubits]
+        clbits = [qc.find_bit(c).index for c in instruction.clbits]
+        digest.update(f"{qubits}{clbits};".encode('utf-8'))
+
+def circuit_fingerprint(qc):
+    """
+    Structural hash of a circuit: registers, global phase, gate names, params
+    and wiring, including the bodies of custom gates such as the
+    Oracle/Diffuser wrappers. Circuit
+    names and metadata are ignored, so identical experiments built separately
+    hash the same.
+    """
+    digest = hashlib.sha256()
+    _circuit_fingerprint(qc, digest)
+    return digest.hexdigest()
+
+def spec_fingerprint(spec):
+    """Structural hash of a JSON-serializable experiment spec"""
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode('utf-8')).hexdigest()
+
+def make_cache_key(fingerprint, backend, shots, seed=None):
+    """Combines a circuit/spec fingerprint with the execution settings"""
+    return spec_fingerprint({
+        'fingerprint': fingerprint,
+        'backend': backend,
+        'shots': shots,
+        'seed': seed,
+    })
+
+class ResultCache:
+    """
+    Persistent counts cache with least-recently-used eviction once the
+    stored payload exceeds max_bytes.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.time_saved = 0.0
+
+        self.conn = sqlite3.connect(str(self.path), timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL;")
+        self.conn.execute("PRAGMA synchronous=NORMAL;")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT PRIMARY KEY,"
+            " counts TEXT NOT NULL,"
+            " elapsed REAL NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS results_last_access ON results(last_access);"
+        )
+        self.conn.commit()
+
+    def get(self, key):
+        """
+        Returns (counts, elapsed) for a cached experiment, or None on a miss.
+        elapsed is the wall-clock time of the original run.
+        """
+        row = self.conn.execute(
+            "SELECT counts, elapsed FROM results WHERE key = ?;", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.conn.execute(
+            "UPDATE results SET last_access = ? WHERE key = ?;", (time.time(), key)
+        )
+        self.conn.commit()
+        self.hits += 1
+        self.time_saved += row[1]
+        return json.loads(row[0]), row[1]
+
+    def put(self, key, counts, elapsed):
+        """Stores counts for an experiment and evicts old entries if needed"""
+        payload = json.dumps(counts, sort_keys=True)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO results (key, counts, elapsed, size, last_access)"
+            " VALUES (?, ?, ?, ?, ?);",
+            (key, payload, float(elapsed), len(payload), time.time()),
+        )
+        self._evict()
+        self.conn.commit()
+
+    def _evict(self):
+        (total,) = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM results;").fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self.conn.execute(
+            "SELECT key, size FROM results ORDER BY last_access ASC;"
+        ).fetchall()
+        stale = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        self.conn.executemany("DELETE FROM results WHERE key = ?;", stale)
+
+    def run(self, key, execute):
+        """
+        Returns cached counts for key, or calls execute() -> counts, caches
+        and returns them.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached[0]
+        start = time.time()
+        counts = execute()
+        self.put(key, counts, time.time() - start)
+        return counts
+
+    def report(self):
+        """Prints hit/miss statistics for this session"""
+        total = self.hits + self.misses
+        rate = self.hits / total * 100 if total else 0.0
+        print(f"\nResult cache ({self.path}):")
+        print(f"  Hits: {self.hits}, Misses: {self.misses} ({rate:.1f}% hit rate)")
+        print(f"  Simulation time saved: {self.time_saved:.3f}s")
+
+    def close(self):
+        self.conn.close()
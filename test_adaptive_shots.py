@@ -0,0 +1,50 @@
+"""
+Tests for adaptive shot allocation
+"""
+
+import numpy as np
+
+from adaptive_shots import is_separated, run_adaptive, wilson_interval
+from grover_simulator import simulate_grover
+
+def test_wilson_interval_contains_estimate():
+    low, high = wilson_interval(30, 32, z=2.58)
+    assert low < 30 / 32 < high
+    assert wilson_interval(0, 0, z=1.96) == (0.0, 1.0)
+
+def test_separation_methods():
+    assert is_separated({'11': 30, '01': 1, '10': 1})
+    assert is_separated({'11': 30, '01': 1, '10': 1}, method='bayes')
+    assert not is_separated({'11': 9, '01': 7})
+    assert not is_separated({'11': 9, '01': 7}, method='bayes')
+
+def test_decisive_search_stops_early():
+    seeds = iter(range(100))
+    counts, used, early = run_adaptive(
+        lambda shots: simulate_grover(4, 10, shots=shots, seed=next(seeds)),
+        max_shots=2048,
+    )
+    assert early and used <= 64
+    assert max(counts, key=counts.get) == format(10, '04b')
+
+def test_uninformative_search_exhausts_budget():
+    rng = np.random.default_rng(0)
+
+    def uniform(shots):
+        hits = rng.multinomial(shots, [0.25] * 4)
+        return {format(i, '02b'): int(h) for i, h in enumerate(hits) if h}
+
+    _, used, early = run_adaptive(uniform, max_shots=256)
+    assert used == 256 and not early
+
+def test_false_stop_rate_on_a_tie():
+    rng = np.random.default_rng(1)
+
+    def tie(shots):
+        heads = int(rng.binomial(shots, 0.5))
+        return {'0': heads, '1': shots - heads}
+
+    # Up to 64 checks per run; each check alone at 99% would stop ~5% of runs
+    trials = 300
+    early = sum(run_adaptive(tie, max_shots=2048, confidence=0.99)[2] for _ in range(trials))
+    assert early <= 0.01 * trials
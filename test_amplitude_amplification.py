@@ -0,0 +1,43 @@
+"""
+Tests for amplitude amplification from non-uniform start states
+"""
+
+import numpy as np
+from qiskit import QuantumCircuit
+
+from amplitude_amplification import (amplify, optimal_amplification_iterations,
+                                     prior_state, subspace_prior)
+from grover_simulator import optimal_iterations
+
+def test_uniform_start_reduces_to_grover():
+    for n in range(2, 16):
+        a = 1 / 2**n
+        assert abs(optimal_amplification_iterations(a) - optimal_iterations(n)) <= 1
+
+def test_informative_prior_cuts_oracle_calls():
+    n, secret = 14, 9001
+    uniform = amplify(n, prior_state(n, np.ones(2**n)), secret, seed=2)
+    block = secret - secret % 128
+    informed = amplify(n, subspace_prior(n, range(block, block + 128)), secret, seed=2)
+    assert informed['iterations'] * 10 < uniform['iterations']
+    for result in (uniform, informed):
+        found = max(result['counts'].items(), key=lambda x: x[1])[0]
+        assert int(found, 2) == secret
+        assert result['success_probability'] > 0.99
+
+def test_gate_level_matches_numpy_engine():
+    n, marked = 4, [5, 13]
+    prior = np.linspace(1, 2, 2**n)
+    fast = amplify(n, prior_state(n, prior), marked, shots=4000, seed=3)
+    aer = amplify(n, prior_state(n, prior), marked, shots=4000, seed=3, engine='aer')
+    assert fast['iterations'] == aer['iterations']
+    hits = sum(aer['counts'].get(format(m, '04b'), 0) for m in marked) / 4000
+    assert abs(hits - aer['success_probability']) < 0.03
+
+def test_circuit_state_preparation():
+    n = 3
+    prep = QuantumCircuit(n)
+    prep.h(range(n))
+    result = amplify(n, prep, 6, engine='aer', seed=4)
+    assert result['iterations'] == 2
+    assert max(result['counts'].items(), key=lambda x: x[1])[0] == '110'
@@ -0,0 +1,44 @@
+"""
+Offline tests for the coupling-map-aware GHZ builder
+"""
+
+import numpy as np
+from qiskit.providers.fake_provider import GenericBackendV2
+from qiskit.quantum_info import Statevector
+from qiskit.transpiler import CouplingMap
+
+from ghz_builder import build_ghz_circuit, ghz_depth_report, plan_ghz
+
+def test_cnots_follow_coupling_map():
+    coupling_map = CouplingMap.from_heavy_hex(5)
+    edges = {tuple(sorted(e)) for e in coupling_map.get_edges()}
+    for n in [3, 12, coupling_map.size()]:
+        plan = plan_ghz(coupling_map, n)
+        assert len(plan['schedule']) == n - 1
+        assert all(tuple(sorted((c, t))) in edges for _, c, t in plan['schedule'])
+
+def test_dense_connectivity_gives_log_depth():
+    assert plan_ghz(CouplingMap.from_full(32))['cnot_layers'] == 5
+    assert plan_ghz(CouplingMap.from_line(21))['cnot_layers'] == 11
+
+def test_prepares_ghz_state():
+    qc, _ = build_ghz_circuit(CouplingMap.from_grid(3, 3), 7, measure=False)
+    probabilities = Statevector(qc).probabilities()
+    assert np.isclose(probabilities[0], 0.5)
+    assert np.isclose(probabilities[-1], 0.5)
+
+def test_transpile_needs_no_swaps():
+    coupling_map = CouplingMap.from_grid(4, 5)
+    backend = GenericBackendV2(num_qubits=20, coupling_map=coupling_map, seed=1)
+    qc, layout = build_ghz_circuit(coupling_map, 20)
+    report, _ = ghz_depth_report(qc, layout, backend)
+    assert report['swap_free']
+    assert report['depth_before'] <= 7
+
+def test_barrier_is_not_counted_as_two_qubit_gate():
+    coupling_map = CouplingMap.from_line(2)
+    backend = GenericBackendV2(num_qubits=2, coupling_map=coupling_map, seed=1)
+    qc, layout = build_ghz_circuit(coupling_map, 2)
+    report, _ = ghz_depth_report(qc, layout, backend)
+    assert report['two_qubit_gates'] == 1
+    assert report['swap_free']
@@ -0,0 +1,61 @@
+"""
+Tests for the stabilizer fast path and GHZ fidelity estimator
+"""
+
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.transpiler import CouplingMap
+
+from ghz_builder import build_ghz_circuit
+from ghz_fidelity import (estimate_ghz_fidelity, ghz_population, is_clifford,
+                          measure_ghz_fidelity, parity_expectation,
+                          validate_ghz_stabilizer)
+
+def test_stabilizer_validation_of_large_ghz():
+    ghz, _ = build_ghz_circuit(CouplingMap.from_heavy_hex(7), 100)
+    assert is_clifford(ghz)
+    assert validate_ghz_stabilizer(ghz)
+
+    broken = ghz.remove_final_measurements(inplace=False)
+    broken.z(5)
+    assert not validate_ghz_stabilizer(broken)
+
+def test_non_clifford_detected():
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.t(0)
+    assert not is_clifford(qc)
+
+def test_estimator_on_shot_arrays():
+    rng = np.random.default_rng(0)
+    n, shots = 130, 2000
+    # Half all-zeros, half all-ones: perfect population
+    z_shots = np.repeat(rng.integers(0, 2, size=(shots, 1)), n, axis=1)
+    assert ghz_population(z_shots) == 1.0
+
+    # Fully dephased state: X-basis parity is random
+    x_shots = rng.integers(0, 2, size=(shots, n))
+    assert abs(parity_expectation(x_shots)) < 0.1
+
+    counts = {'0' * 4: 40, '1' * 4: 40, '0101': 20}
+    assert np.isclose(ghz_population(counts), 0.8)
+    assert np.isclose(parity_expectation(counts), 1.0)
+
+    phases = np.array([0, np.pi / 2, np.pi, 3 * np.pi / 2])
+    even, odd, mixed = {'00': 1}, {'01': 1}, {'00': 1, '01': 1}
+    result = estimate_ghz_fidelity(counts, [even, mixed, odd, mixed], phases)
+    assert np.isclose(result['coherence'], 1.0)
+    assert np.isclose(result['fidelity'], 0.9)
+
+def test_ideal_ghz_fidelity_is_one():
+    ghz, _ = build_ghz_circuit(CouplingMap.from_grid(5, 5), 25)
+    result = measure_ghz_fidelity(ghz, shots=200, seed=3)
+    assert np.isclose(result['fidelity'], 1.0)
+
+def test_non_clifford_phase_sets():
+    ghz, _ = build_ghz_circuit(CouplingMap.from_grid(5, 6), 30)
+    result = measure_ghz_fidelity(ghz, shots=4000, num_phases=6, seed=3)
+    assert abs(result['fidelity'] - 1.0) < 0.03
+    with pytest.raises(ValueError, match="num_phases"):
+        measure_ghz_fidelity(ghz, shots=100, num_phases=2)
@@ -0,0 +1,56 @@
+"""
+Tests for the batched many-secret Grover engine
+"""
+
+import numpy as np
+
+from grover_batch import grover_amplitudes, simulate_cases, simulate_grover_batch
+from grover_simulator import apply_grover_iteration, initial_state, optimal_iterations
+from grover_validation import validate_case
+
+def test_recurrence_matches_statevector_engine():
+    n, secret = 9, 300
+    for k in (0, 1, 5, optimal_iterations(n), 40):
+        amplitudes = initial_state(n)
+        for _ in range(k):
+            apply_grover_iteration(amplitudes, [secret])
+        marked, unmarked = grover_amplitudes(n, k)
+        assert np.isclose(amplitudes[secret], marked)
+        assert np.allclose(np.delete(amplitudes, secret), unmarked)
+
+def test_batch_counts_follow_analytic_distribution():
+    n, shots = 6, 2048
+    secrets = list(range(2**n))
+    results = simulate_grover_batch(n, secrets, shots=shots, seed=4)
+    assert all(sum(c.values()) == shots for c in results)
+    k = optimal_iterations(n)
+    assert all(validate_case(c, n, k, s, 0.01 / len(secrets))['passed']
+               for s, c in zip(secrets, results))
+
+def test_unmarked_outcomes_never_include_the_secret_twice():
+    secrets, shots = [0, 7, 3], 4000
+    results = simulate_grover_batch(3, secrets, iterations=0, shots=shots, seed=5)
+    # Same first draw as the engine: the marked-state hits per secret
+    hits = np.random.default_rng(5).binomial(shots, 1 / 8, size=len(secrets))
+    for secret, hit, counts in zip(secrets, hits, results):
+        # An unmarked draw landing on the secret would overwrite or add to
+        # its count, and the total would no longer be shots
+        assert counts[format(secret, '03b')] == hit
+        assert sum(counts.values()) == shots
+        assert len(counts) == 8
+
+def test_large_registers_keep_counts_per_secret():
+    n, shots = 60, 10
+    secrets = [2**n - 1] * 40 + [0, 2**59]
+    results = simulate_grover_batch(n, secrets, iterations=0, shots=shots, seed=1)
+    # Unmarked draws are spread over 2^60 states: every shot lands on its own key
+    assert all(sum(c.values()) == shots for c in results)
+    assert all(len(key) == n for c in results for key in c)
+
+def test_mixed_case_table_keeps_order():
+    cases = [(4, 10), (1, 1), (3, 5), (4, 15), (2, 0)]
+    results = simulate_cases(cases, seed=6)
+    for (n, secret), counts in zip(cases, results):
+        assert all(len(key) == n for key in counts)
+        if n > 1:
+            assert max(counts.items(), key=lambda x: x[1])[0] == format(secret, f'0{n}b')
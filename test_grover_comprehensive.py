@@ -3,11 +3,18 @@ Comprehensive Testing Suite for Grover's Algorithm Implementation
 Tests various qubit sizes, edge cases, and validates the quantum search
 """
 
+import itertools
+
 from qiskit import QuantumCircuit, transpile
 from qiskit_aer import AerSimulator
 import numpy as np
 import math
 
+from adaptive_shots import run_adaptive
+from grover_batch import simulate_cases
+from grover_validation import validate_case
+from result_cache import ResultCache, circuit_fingerprint, make_cache_key
+
 def make_oracle(n, secret):
     """Oracle that marks the secret state"""
     qc = QuantumCircuit(n)
@@ -68,8 +75,14 @@ def diffuser(n):
     
     return qc.to_gate(label="Diffuser")
 
-def test_grover(secret, n, shots=2048):
-    """Test Grover's algorithm for a specific configuration"""
+def test_grover(secret, n, shots=2048, cache=None, adaptive=False, seed=None):
+    """
+    Test Grover's algorithm for a specific configuration.
+    With adaptive=True, shots is a budget and sampling stops early once the
+    leading outcome is statistically separated from the runner-up.
+    Only seeded runs go through the cache: an unseeded run is a fresh sample,
+    and replaying a cached one would freeze the suite's statistics.
+    """
     iterations = int(np.floor((np.pi/4) * np.sqrt(2**n)))
     
     qc = QuantumCircuit(n, n)
@@ -82,18 +95,48 @@ def test_grover(secret, n, shots=2048):
     qc.measure(range(n), range(n))
     
     simulator = AerSimulator()
-    tqc = transpile(qc, simulator)
-    job = simulator.run(tqc, shots=shots)
-    counts = job.result().get_counts()
     
-    most_probable = max(counts.items(), key=lambda x: x[1])
-    found = int(most_probable[0], 2)
-    confidence = most_probable[1] / shots * 100
+    def execute():
+        tqc = transpile(qc, simulator)
+        if adaptive:
+            batch_seeds = itertools.count(seed) if seed is not None else itertools.repeat(None)
+            counts, _, _ = run_adaptive(
+                lambda batch_shots: simulator.run(
+                    tqc, shots=batch_shots, seed_simulator=next(batch_seeds)
+                ).result().get_counts(),
+                max_shots=shots,
+            )
+            return counts
+        job = simulator.run(tqc, shots=shots, seed_simulator=seed)
+        return job.result().get_counts()
+    
+    if cache is not None and seed is not None:
+        budget = f"adaptive:{shots}" if adaptive else shots
+        key = make_cache_key(circuit_fingerprint(qc), simulator.name, budget, seed)
+        counts = cache.run(key, execute)
+    else:
+        counts = execute()
     
+    found, confidence = summarize_counts(counts)
     return found, confidence, counts
 
-def run_comprehensive_tests():
-    """Run comprehensive test suite"""
+def summarize_counts(counts):
+    """Most probable outcome and its share of the shots (in %)"""
+    most_probable = max(counts.items(), key=lambda x: x[1])
+    found = int(most_probable[0], 2)
+    confidence = most_probable[1] / sum(counts.values()) * 100
+    return found, confidence
+
+def run_comprehensive_tests(cache=None, alpha=0.01, engine='aer', seed=None):
+    """
+    Run comprehensive test suite.
+    A case passes when its counts are consistent with the analytic Grover
+    distribution; alpha is the suite-wide false-failure rate.
+    engine='batched' samples every case from one vectorized pass of the
+    batched NumPy engine instead of simulating each circuit in Aer.
+    seed (case i uses seed + i) replays a previous run, from the cache if
+    given; unseeded runs draw fresh samples and are not cached.
+    """
     print("="*70)
     print("COMPREHENSIVE GROVER'S ALGORITHM TEST SUITE")
     print("="*70)
@@ -116,21 +159,32 @@ def run_comprehensive_tests():
     results = []
     passed = 0
     failed = 0
+    case_alpha = alpha / len(test_cases)
+    if engine == 'batched':
+        batch = simulate_cases([(n, secret) for n, secret, _ in test_cases], seed=seed)
     
-    for n, secret, description in test_cases:
+    for case_index, (n, secret, description) in enumerate(test_cases):
         print(f"\n{'─'*70}")
         print(f"TEST: {description}")
         print(f"  Qubits: {n}, Target: {secret} (binary: {bin(secret)})")
         
         try:
-            found, confidence, counts = test_grover(secret, n)
+            if engine == 'batched':
+                counts = batch[case_index]
+                found, confidence = summarize_counts(counts)
+            else:
+                found, confidence, counts = test_grover(
+                    secret, n, cache=cache, seed=None if seed is None else seed + case_index)
             success = (found == secret)
+            iterations = int(np.floor((np.pi/4) * np.sqrt(2**n)))
+            validation = validate_case(counts, n, iterations, secret, case_alpha)
             
             print(f"  Result: {found} (binary: {bin(found)})")
             print(f"  Confidence: {confidence:.1f}%")
-            print(f"  Status: {'✓ PASS' if success else '✗ FAIL'}")
+            print(f"  Chi-squared p-value: {validation['chi_squared']['p_value']:.3f}")
+            print(f"  Status: {'✓ PASS' if validation['passed'] else '✗ FAIL'}")
             
-            if success and confidence > 90:
+            if validation['passed']:
                 passed += 1
             else:
                 failed += 1
@@ -141,7 +195,8 @@ def run_comprehensive_tests():
                 'target': secret,
                 'found': found,
                 'confidence': confidence,
-                'success': success
+                'success': success,
+                'validated': validation['passed']
             })
             
         except Exception as e:
@@ -163,12 +218,12 @@ def run_comprehensive_tests():
     print("="*70)
     
     for r in results:
-        status = "✓" if r['success'] else "✗"
+        status = "✓" if r['validated'] else "✗"
         print(f"{status} {r['test']}: Found {r['found']}/{r['target']} ({r['confidence']:.1f}%)")
     
     return results, passed, failed
 
-def test_edge_cases():
+def test_edge_cases(cache=None, engine='aer', seed=None):
     """Test edge cases and boundary conditions"""
     print("\n" + "="*70)
     print("EDGE CASE TESTING")
@@ -182,9 +237,16 @@ def test_edge_cases():
         ("Power of 2 (8)", 4, 8),
     ]
     
-    for description, n, secret in edge_tests:
+    if engine == 'batched':
+        batch = simulate_cases([(n, secret) for _, n, secret in edge_tests], seed=seed)
+    
+    for case_index, (description, n, secret) in enumerate(edge_tests):
         print(f"\n{description}:")
-        found, confidence, _ = test_grover(secret, n)
+        if engine == 'batched':
+            found, confidence = summarize_counts(batch[case_index])
+        else:
+            found, confidence, _ = test_grover(
+                secret, n, cache=cache, seed=None if seed is None else seed + case_index)
         success = "✓ PASS" if found == secret else "✗ FAIL"
         print(f"  Target: {secret}, Found: {found}, Confidence: {confidence:.1f}% - {success}")
 
@@ -217,11 +279,19 @@ if __name__ == "__main__":
     print("QUANTUM GROVER'S ALGORITHM - COMPREHENSIVE TEST SUITE")
     print("█"*70)
     
+    # Unseeded runs draw fresh samples every time and bypass the cache; set
+    # a seed to replay a run, and re-runs then reuse the persistent cache
+    seed = None
+    cache = ResultCache()
+    
     # Run main test suite
-    results, passed, failed = run_comprehensive_tests()
+    results, passed, failed = run_comprehensive_tests(cache=cache, seed=seed)
     
     # Run edge case tests
-    test_edge_cases()
+    test_edge_cases(cache=cache, seed=seed)
+    cache.report()
+    if seed is None:
+        print("  (unseeded run: fresh samples, nothing read from or written to the cache)")
     
     # Run performance tests
     test_performance()
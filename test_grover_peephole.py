@@ -0,0 +1,37 @@
+"""
+Tests for the Grover-specific Pauli-frame peephole optimizer
+"""
+
+import numpy as np
+from qiskit import transpile
+from qiskit.quantum_info import Statevector
+from qiskit.transpiler import PassManager
+from qiskit_aer import AerSimulator
+
+from grover_peephole import GroverPeephole, gate_summary, push_pauli_frames
+from quantum_sudoku_decrypt import grover_circuit
+
+def test_equal_up_to_global_phase():
+    for n in range(1, 7):
+        for secret in {0, 2**n - 1, (5 * n) % 2**n}:
+            for k in (1, 2, 3):
+                qc = grover_circuit(n, secret, k, measure=False)
+                overlap = np.vdot(Statevector(qc).data, Statevector(push_pauli_frames(qc)).data)
+                assert abs(abs(overlap) - 1) < 1e-9
+
+def test_masks_collapse_across_iterations():
+    n, secret, k = 8, 77, 12
+    optimized = push_pauli_frames(grover_circuit(n, secret, k, measure=False))
+    # One mask layer survives, not one per oracle call
+    masked = n - bin(secret).count('1')
+    x_gates = optimized.count_ops().get('x', 0)
+    assert x_gates < 2 * k * masked
+    assert gate_summary(optimized)['gates'] < 0.5 * gate_summary(grover_circuit(n, secret, k, measure=False))['gates']
+
+def test_measured_counts_unchanged():
+    qc = grover_circuit(5, 19, 4)
+    simulator = AerSimulator()
+    optimized = PassManager([GroverPeephole()]).run(qc)
+    counts = simulator.run(transpile(optimized, simulator), shots=2000, seed_simulator=1).result().get_counts()
+    assert max(counts.items(), key=lambda x: x[1])[0] == format(19, '05b')
+    assert counts[format(19, '05b')] > 1900
@@ -0,0 +1,53 @@
+"""
+Tests for the NumPy Grover engine and its checkpoint/resume support
+"""
+
+import numpy as np
+import pytest
+
+import grover_simulator
+from grover_simulator import load_checkpoint, simulate_grover
+
+def test_finds_secret():
+    counts = simulate_grover(6, 42, shots=1000, seed=1)
+    found = int(max(counts.items(), key=lambda x: x[1])[0], 2)
+    assert found == 42
+    assert counts[format(42, '06b')] > 950
+
+def test_resume_after_preemption_matches_uninterrupted_run(tmp_path, monkeypatch):
+    reference = simulate_grover(8, 77, shots=4096, seed=3)
+
+    checkpoint = tmp_path / "run.ckpt"
+    real_iteration = grover_simulator.apply_grover_iteration
+    calls = {'n': 0}
+
+    def preempted(amplitudes, marked):
+        calls['n'] += 1
+        if calls['n'] == 8:
+            raise KeyboardInterrupt("preempted")
+        return real_iteration(amplitudes, marked)
+
+    monkeypatch.setattr(grover_simulator, 'apply_grover_iteration', preempted)
+    with pytest.raises(KeyboardInterrupt):
+        simulate_grover(8, 77, shots=4096, seed=3,
+                        checkpoint_path=checkpoint, checkpoint_every=5)
+    monkeypatch.undo()
+
+    _, iteration, _, _ = load_checkpoint(checkpoint)
+    assert iteration == 5
+
+    resumed = simulate_grover(8, 77, shots=4096, seed=3,
+                              checkpoint_path=checkpoint, checkpoint_every=5)
+    assert resumed == reference
+
+    # A finished checkpoint replays the same sample without re-simulating
+    amplitudes, iteration, _, _ = load_checkpoint(checkpoint)
+    assert iteration == grover_simulator.optimal_iterations(8)
+    assert np.isclose(np.sum(amplitudes**2), 1.0)
+    assert simulate_grover(8, 77, shots=4096, seed=3, checkpoint_path=checkpoint) == reference
+
+def test_checkpoint_parameter_mismatch_is_rejected(tmp_path):
+    checkpoint = tmp_path / "run.ckpt"
+    simulate_grover(5, 3, seed=0, checkpoint_path=checkpoint)
+    with pytest.raises(ValueError):
+        simulate_grover(5, 4, seed=0, checkpoint_path=checkpoint)
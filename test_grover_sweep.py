@@ -0,0 +1,27 @@
+"""
+Tests for the single-pass Grover iteration sweep
+"""
+
+import numpy as np
+
+from grover_sweep import (analytic_success_probability, sweep_iterations_aer,
+                          sweep_iterations_numpy)
+from ibm_quantum_location_decrypt import grover_iteration_plan
+
+def test_numpy_sweep_matches_analytic_curve():
+    result = sweep_iterations_numpy(10, 321, max_iterations=60)
+    expected = analytic_success_probability(10, np.arange(61))
+    assert np.allclose(result['success'], expected)
+    assert result['optimal_k'] == result['formula_k'] == 25
+
+def test_aer_sweep_matches_numpy_sweep():
+    aer = sweep_iterations_aer(6, 4, max_iterations=7)
+    fast = sweep_iterations_numpy(4, 6, max_iterations=7)
+    assert np.allclose(aer['success'], fast['success'])
+    assert aer['optimal_k'] == 3
+
+def test_iteration_caps_follow_quantum_key_search():
+    assert grover_iteration_plan(16) == (201, 201)
+    assert grover_iteration_plan(24) == (3216, 1000)
+    assert grover_iteration_plan(40)[1] == 100
+    assert grover_iteration_plan(64) == (2, 2)
@@ -0,0 +1,30 @@
+"""
+Tests for the analytic-reference validation harness
+"""
+
+from grover_simulator import optimal_iterations, simulate_grover
+from grover_validation import (theoretical_probabilities, validate_case,
+                               validate_grover_engine)
+
+def test_theoretical_probabilities_sum_to_one():
+    for n, marked in [(1, 0), (2, 3), (6, [1, 9, 40]), (12, 100)]:
+        k = optimal_iterations(n, 1 if isinstance(marked, int) else len(marked))
+        p_marked, p_unmarked = theoretical_probabilities(n, k, marked)
+        num_marked = 1 if isinstance(marked, int) else len(marked)
+        assert abs(p_marked * num_marked + p_unmarked * (2**n - num_marked) - 1) < 1e-12
+
+def test_engine_validates_up_to_20_qubits():
+    cases = [(n, (7919 * n) % 2**n) for n in range(1, 21)] + [(8, [3, 77, 200])]
+    results = validate_grover_engine(cases, seed=5)
+    assert all(r['passed'] for r in results)
+
+def test_wrong_iteration_count_is_rejected():
+    n, secret = 8, 77
+    k = optimal_iterations(n)
+    counts = simulate_grover(n, secret, iterations=k - 3, shots=2048, seed=3)
+    assert not validate_case(counts, n, k, secret)['passed']
+
+def test_impossible_outcome_is_rejected():
+    # After one iteration on 2 qubits the target has probability exactly 1
+    assert validate_case({'11': 2048}, 2, 1, 3)['passed']
+    assert not validate_case({'11': 2047, '01': 1}, 2, 1, 3)['passed']
@@ -0,0 +1,76 @@
+"""
+Tests for offline hardware emulation with fake backends
+"""
+
+import time
+
+import pytest
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister, transpile
+from qiskit.providers import JobStatus
+from qiskit_ibm_runtime.exceptions import IBMBackendError
+from qiskit_ibm_runtime.fake_provider import FakeManilaV2
+
+from hardware_emulation import EmulatedSampler, FakeRuntimeService, sampler_for
+from ibm_quantum_location_decrypt import sampler_result_counts
+from quantum_sudoku_decrypt import grover_circuit, run_grover_search
+
+def test_queue_latency_and_noisy_counts():
+    service = FakeRuntimeService(backends=[FakeManilaV2()], queue_seconds=0.2, seed=3)
+    backend = service.least_busy(operational=True, simulator=False)
+    tqc = transpile(grover_circuit(2, 2, 1), backend, seed_transpiler=1)
+
+    job = sampler_for(backend).run([tqc], shots=1000)
+    assert job.job_id().startswith("emulated-")
+    assert job.status() in (JobStatus.QUEUED, JobStatus.RUNNING)
+    counts = job.result()[0].data.c.get_counts()
+    assert time.monotonic() >= job.ready_at
+    assert job.status() == JobStatus.DONE
+    assert sum(counts.values()) == 1000
+    # One iteration finds 1 of 4 exactly; device noise leaves some errors
+    assert 800 < counts['10'] < 1000
+
+def test_sampler_returns_bit_arrays_per_register():
+    service = FakeRuntimeService(backends=[FakeManilaV2()], queue_seconds=0, seed=1)
+    backend = service.backend('fake_manila')
+    qr, a, b = QuantumRegister(3), ClassicalRegister(1, 'a'), ClassicalRegister(2, 'b')
+    qc = QuantumCircuit(qr, a, b)
+    qc.x(qr[0])
+    qc.measure(qr[0], a[0])
+    qc.measure(qr[1:], b)
+
+    sampler = sampler_for(backend)
+    assert isinstance(sampler, EmulatedSampler)
+    result = sampler.run([transpile(qc, backend, seed_transpiler=1)], shots=500).result()
+    data = result[0].data
+    assert data.a.num_shots == data.b.num_shots == 500
+    assert data.a.get_counts().get('1', 0) > 450
+    assert data.b.get_counts().get('00', 0) > 450
+
+def test_rejects_what_hardware_rejects():
+    backend = FakeRuntimeService(backends=[FakeManilaV2()], queue_seconds=0).backend('fake_manila')
+    with pytest.raises(ValueError, match="transpile"):
+        sampler_for(backend).run([grover_circuit(2, 1, 1)]).result()
+    # IBMBackend.run() is removed in the runtime; the emulation must not accept it
+    with pytest.raises(IBMBackendError):
+        backend.run(transpile(grover_circuit(2, 1, 1), backend))
+    with pytest.raises(ValueError):
+        FakeRuntimeService(backends=[FakeManilaV2()]).least_busy(min_num_qubits=100)
+
+def test_grover_search_hardware_path_runs_emulated(monkeypatch):
+    service = FakeRuntimeService(backends=[FakeManilaV2()], queue_seconds=0, seed=2)
+    monkeypatch.setattr('quantum_sudoku_decrypt.FakeRuntimeService', lambda: service)
+    # Any fallback to the local simulator fails the test
+    monkeypatch.setattr('quantum_sudoku_decrypt.AerSimulator', None)
+    found, counts = run_grover_search(5, n=3, shots=500, use_ibm=True, emulate=True)
+    assert found == 5
+    assert sum(counts.values()) == 500
+
+def test_sampler_counts_are_read_by_register_name():
+    backend = FakeRuntimeService(backends=[FakeManilaV2()], queue_seconds=0, seed=5).backend()
+    qc = QuantumCircuit(QuantumRegister(2), ClassicalRegister(2, 'cr'))
+    qc.x(0)
+    qc.measure([0, 1], [0, 1])
+    result = sampler_for(backend).run([transpile(qc, backend, seed_transpiler=1)], shots=200).result()
+    assert sampler_result_counts(result, 'cr', 2, 200).get('01', 0) > 180
+    with pytest.raises(ValueError, match="'c'"):
+        sampler_result_counts(result, 'c', 2, 200)
@@ -0,0 +1,47 @@
+"""
+Tests for the aggregated histogram views
+"""
+
+import numpy as np
+
+from histogram_views import (OTHER, bound_view, hamming_weight_view,
+                             marginal_view, top_k_view)
+from quantum_sudoku_decrypt import run_grover_search
+
+COUNTS = {'000': 50, '111': 30, '001': 10, '100': 6, '110': 4}
+
+def test_views_from_counts_dict():
+    assert hamming_weight_view(COUNTS) == {0: 50, 1: 16, 2: 4, 3: 30}
+    assert top_k_view(COUNTS, k=2) == {'000': 50, '111': 30, OTHER: 20}
+    # Qubit 0 is the rightmost character
+    assert marginal_view(COUNTS, [0]) == {'0': 60, '1': 40}
+    assert marginal_view(COUNTS, [2, 1]) == {'00': 60, '11': 34, '10': 6}
+
+def test_dense_and_pair_arrays_match_dict():
+    dense = np.zeros(8, dtype=np.int64)
+    for key, count in COUNTS.items():
+        dense[int(key, 2)] = count
+    outcomes = np.array([int(k, 2) for k in COUNTS])
+    pair = (outcomes, np.array(list(COUNTS.values())))
+    for data in (dense, pair):
+        assert hamming_weight_view(data, num_bits=3) == hamming_weight_view(COUNTS)
+        assert top_k_view(data, k=3, num_bits=3) == top_k_view(COUNTS, k=3)
+
+def test_bars_are_bounded():
+    view = {w: 1 for w in range(101)}
+    bounded = bound_view(view, max_bars=10)
+    assert len(bounded) == 10
+    assert sum(bounded.values()) == 101
+
+    wide = {format(i, '08b'): i + 1 for i in range(256)}
+    bounded = bound_view(wide, max_bars=16)
+    assert len(bounded) == 16
+    assert bounded[OTHER] == sum(wide.values()) - sum(range(242, 257))
+
+def test_grover_search_prints_top_k_and_other(capsys):
+    # ~4% of the shots miss the secret and spread over the other 15 outcomes
+    run_grover_search(9, n=4, shots=400, seed=1)
+    lines = capsys.readouterr().out.split("Measurement Results:")[1].splitlines()
+    states = [line for line in lines if line.startswith("  State |")]
+    assert len(states) == 5
+    assert any(line.startswith("  Other states:") for line in lines)
@@ -0,0 +1,69 @@
+"""
+Tests for partial search (leading bits of the target)
+"""
+
+import numpy as np
+import pytest
+from qiskit.quantum_info import Statevector
+from qiskit_ibm_runtime.fake_provider import FakeManilaV2
+
+from grover_simulator import apply_grover_iteration, initial_state
+from hardware_emulation import FakeRuntimeService
+from partial_search import (apply_local_iteration, partial_search_amplitudes,
+                            partial_search_success, plan_partial_search,
+                            simulate_partial_search, target_block)
+from quantum_sudoku_decrypt import partial_search_circuit, run_partial_search
+
+def test_closed_form_matches_recurrence_and_statevector():
+    n, m, secret = 7, 2, 83
+    for l1, l2 in [(0, 0), (0, 5), (3, 2), (6, 0), (2, 7)]:
+        amplitudes = initial_state(n)
+        for _ in range(l1):
+            apply_grover_iteration(amplitudes, [secret])
+        for _ in range(l2):
+            apply_local_iteration(amplitudes, [secret], m)
+        apply_grover_iteration(amplitudes, [secret])
+        exact = (amplitudes**2).reshape(2**m, -1).sum(axis=1)[target_block(n, m, secret)]
+
+        target, same_block, _ = partial_search_amplitudes(n, m, l1, l2)
+        assert np.isclose(target**2 + (2**(n - m) - 1) * same_block**2, exact)
+        assert np.isclose(partial_search_success(n, m, l1, l2), exact)
+
+def test_circuit_matches_plan():
+    n, m, secret = 6, 2, 45
+    plan = plan_partial_search(n, m)
+    qc = partial_search_circuit(n, m, secret, plan['global_iterations'], plan['local_iterations'])
+    qc.remove_final_measurements()
+    probabilities = Statevector(qc).probabilities(qargs=list(range(n - m, n)))
+    assert np.isclose(probabilities[target_block(n, m, secret)], plan['success_probability'])
+
+def test_fewer_queries_than_full_search():
+    for n, m in [(12, 1), (16, 2), (20, 4)]:
+        plan = plan_partial_search(n, m)
+        assert plan['queries'] < plan['full_queries']
+        assert plan['success_probability'] >= plan['full_success_probability'] - 1e-12
+    # Two blocks: local search alone needs about 1/sqrt(2) of the queries
+    assert 0.25 < plan_partial_search(16, 1)['query_reduction'] < 0.32
+    with pytest.raises(ValueError):
+        plan_partial_search(4, 4)
+
+def test_engines_find_leading_bits():
+    n, m, secret = 8, 3, 201
+    expected = format(target_block(n, m, secret), '03b')
+    for engine in ('aer', 'numpy', 'batched'):
+        block, counts, plan = run_partial_search(secret, n=n, m=m, shots=500,
+                                                 engine=engine, seed=2)
+        assert block == target_block(n, m, secret)
+        assert counts[expected] > 480
+        assert all(len(key) == m for key in counts)
+    counts = simulate_partial_search(n, m, secret, shots=500, seed=2, engine='batched')
+    assert max(counts.items(), key=lambda x: x[1])[0] == expected
+
+def test_hardware_path_runs_emulated(monkeypatch):
+    service = FakeRuntimeService(backends=[FakeManilaV2()], queue_seconds=0, seed=4)
+    monkeypatch.setattr('quantum_sudoku_decrypt.FakeRuntimeService', lambda: service)
+    # Any fallback to the local simulator fails the test
+    monkeypatch.setattr('quantum_sudoku_decrypt.AerSimulator', None)
+    block, counts, _ = run_partial_search(6, n=3, m=1, shots=500, use_ibm=True, emulate=True)
+    assert block == target_block(3, 1, 6)
+    assert sum(counts.values()) == 500
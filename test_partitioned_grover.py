@@ -0,0 +1,25 @@
+"""
+Tests for partitioned parallel Grover search
+"""
+
+from grover_simulator import optimal_iterations
+from partitioned_grover import partitioned_search, search_partition
+
+def test_only_the_owning_partition_hits():
+    result = partitioned_search(10, 700, m=2, shots=128, workers=2, seed=0)
+    assert result['hits'] == [700]
+    assert [r['hit'] for r in result['results']] == [False, False, True, False]
+    assert result['queries'] == 4 * optimal_iterations(8)
+    assert result['verifications'] == 4
+    assert result['parallel_queries'] < result['monolithic_queries']
+
+def test_single_partition_matches_monolithic_search():
+    result = partitioned_search(10, 700, m=0, shots=128, workers=1, seed=0)
+    assert result['hits'] == [700]
+    assert result['queries'] == result['monolithic_queries']
+    assert result['verifications'] == result['monolithic_verifications'] == 1
+
+def test_empty_partition_returns_unverified_candidate():
+    result = search_partition(8, 1, partition=0, marked=[200], shots=64, seed=1)
+    assert not result['hit']
+    assert 0 <= result['candidate'] < 128
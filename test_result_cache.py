@@ -0,0 +1,57 @@
+"""
+Tests for the SQLite-backed Grover result cache
+"""
+
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+
+from quantum_sudoku_decrypt import grover_circuit, run_grover_search
+from result_cache import ResultCache, circuit_fingerprint, make_cache_key
+
+def build(secret, n=3):
+    return grover_circuit(n, secret, iterations=1)
+
+def test_fingerprint_is_structural():
+    assert circuit_fingerprint(build(5)) == circuit_fingerprint(build(5))
+    assert circuit_fingerprint(build(5)) != circuit_fingerprint(build(6))
+
+def test_fingerprint_covers_registers_and_phase():
+    def bell(qc):
+        qc.h(0)
+        qc.cx(0, 1)
+        return qc
+
+    circuits = [
+        bell(QuantumCircuit(QuantumRegister(2, 'q'), ClassicalRegister(2, 'meas'))),
+        bell(QuantumCircuit(2, 2)),
+        bell(QuantumCircuit(QuantumRegister(2, 'q'), ClassicalRegister(1, 'x'),
+                            ClassicalRegister(1, 'y'))),
+        bell(QuantumCircuit(2, 2, global_phase=0.5)),
+    ]
+    for qc in circuits:
+        qc.measure([0, 1], [0, 1])
+    assert len({circuit_fingerprint(qc) for qc in circuits}) == 4
+
+def test_hits_misses_and_eviction(tmp_path):
+    cache = ResultCache(tmp_path / "results.sqlite", max_bytes=40)
+    key_a = make_cache_key(circuit_fingerprint(build(1)), "aer_simulator", 100, seed=1)
+    key_b = make_cache_key(circuit_fingerprint(build(2)), "aer_simulator", 100, seed=1)
+
+    assert cache.run(key_a, lambda: {'001': 90, '000': 10}) == {'001': 90, '000': 10}
+    assert cache.run(key_a, lambda: {'111': 100}) == {'001': 90, '000': 10}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Storing a second entry exceeds the size limit and evicts the LRU one
+    cache.put(key_b, {'010': 80, '011': 20}, 0.5)
+    assert cache.get(key_a) is None
+    assert cache.get(key_b)[0] == {'010': 80, '011': 20}
+    cache.close()
+
+def test_only_seeded_searches_are_cached(tmp_path):
+    cache = ResultCache(tmp_path / "results.sqlite")
+    for _ in range(2):
+        run_grover_search(5, n=3, shots=64, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 0)
+    first = run_grover_search(5, n=3, shots=64, cache=cache, seed=3)[1]
+    assert run_grover_search(5, n=3, shots=64, cache=cache, seed=3)[1] == first
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.close()
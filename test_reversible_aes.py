@@ -0,0 +1,52 @@
+"""
+Tests for the streaming reversible AES-128 oracle
+"""
+
+from reversible_aes import (BitSimulator, QasmWriter, ResourceCounter, ReversibleAES128,
+                            TEST_CIPHERTEXT, gf_mul, stream_to, verify_known_answer)
+
+def classical_sbox(x):
+    inverse = next((y for y in range(256) if gf_mul(x, y) == 1), 0)
+    result = 0x63
+    for shift in range(5):
+        result ^= ((inverse << shift) | (inverse >> (8 - shift))) & 0xFF
+    return result
+
+def test_sbox_matches_table_and_cleans_workspace():
+    aes = ReversibleAES128()
+    x, out = aes.byte(aes.key, 0), aes.byte(aes.states[0], 0)
+    for value in range(256):
+        sim = BitSimulator(aes.num_qubits)
+        sim.load(x, value)
+        stream_to(aes.sbox(x, out), sim)
+        assert sim.read(out) == classical_sbox(value)
+        assert not any(sim.bits[q] for q in aes.pool)
+
+def test_known_answer_and_uncomputation():
+    ciphertext, flag, restored = verify_known_answer()
+    assert ciphertext == TEST_CIPHERTEXT
+    assert flag == 1 and restored
+
+def test_uncomputation_steps_are_at_most_one_sbox():
+    aes = ReversibleAES128()
+    sbox_gates = sum(1 for _ in aes.sbox(aes.byte(aes.key, 0), aes.byte(aes.states[1], 0)))
+    assert max(sum(1 for _ in step()) for step in aes.steps()) == sbox_gates
+
+def test_wrong_key_is_not_flagged():
+    _, flag, restored = verify_known_answer(key=bytes(15) + b'\x01')
+    assert flag == 0 and restored
+
+def test_stream_sinks_agree(tmp_path):
+    aes = ReversibleAES128()
+    counter = ResourceCounter(aes.num_qubits)
+    writer = QasmWriter(tmp_path / "sbox.qasm", aes.num_qubits)
+    total = stream_to(aes.sbox(aes.byte(aes.key, 0), aes.byte(aes.states[0], 0)),
+                      counter, writer)
+    writer.close()
+
+    summary = counter.summary()
+    assert summary['gates'] == total
+    assert summary['toffoli'] == 2 * 4 * 92  # chain + uncompute, 4 multiplications
+    lines = (tmp_path / "sbox.qasm").read_text().splitlines()
+    assert lines[2] == f"qubit[{aes.num_qubits}] q;"
+    assert len(lines) == 3 + total
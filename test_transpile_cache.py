@@ -0,0 +1,71 @@
+"""
+Tests for the on-disk QPY transpile cache
+"""
+
+import os
+
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit_aer import AerSimulator
+
+from quantum_sudoku_decrypt import grover_circuit
+from transpile_cache import TranspileCache, transpile_key
+
+def test_second_process_reuses_transpiled_circuit(tmp_path):
+    backend = AerSimulator()
+    qc = grover_circuit(4, 9, 1)
+    first = TranspileCache(tmp_path).transpile(qc, backend, optimization_level=2)
+
+    # A fresh instance stands in for a new short-lived process
+    cache = TranspileCache(tmp_path)
+    second = cache.transpile(grover_circuit(4, 9, 1), backend, optimization_level=2)
+    assert cache.hits == 1 and cache.misses == 0
+    assert second.count_ops() == first.count_ops()
+
+def test_key_depends_on_circuit_and_settings():
+    backend = AerSimulator()
+    qc = grover_circuit(4, 9, 1)
+    key = transpile_key(qc, backend, optimization_level=1)
+    assert key == transpile_key(grover_circuit(4, 9, 1), backend, optimization_level=1)
+    assert key != transpile_key(grover_circuit(4, 10, 1), backend, optimization_level=1)
+    assert key != transpile_key(qc, backend, optimization_level=3)
+
+def test_lru_eviction_keeps_recently_used(tmp_path):
+    backend = AerSimulator()
+    cache = TranspileCache(tmp_path)
+    circuits = [grover_circuit(3, s, 1) for s in range(3)]
+    keys = [transpile_key(qc, backend) for qc in circuits]
+    for qc in circuits:
+        cache.transpile(qc, backend)
+    sizes = {k: os.path.getsize(tmp_path / f"{k}.qpy") for k in keys}
+
+    # Make entry 0 the most recently used, then shrink the limit to two files
+    for i, key in enumerate(keys[1:] + keys[:1]):
+        os.utime(tmp_path / f"{key}.qpy", (1000 + i, 1000 + i))
+    cache.max_bytes = sizes[keys[0]] + sizes[keys[2]]
+    cache._evict()
+    assert sorted(p.stem for p in tmp_path.glob('*.qpy')) == sorted([keys[0], keys[2]])
+    assert not list(tmp_path.glob('*.tmp'))
+
+def test_register_layout_is_part_of_the_key(tmp_path):
+    def bell(creg):
+        qc = QuantumCircuit(QuantumRegister(2, 'q'), ClassicalRegister(2, creg))
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.measure([0, 1], [0, 1])
+        return qc
+
+    cache = TranspileCache(tmp_path)
+    cache.transpile(bell('meas'), AerSimulator())
+    tqc = cache.transpile(bell('c'), AerSimulator())
+    assert cache.hits == 0
+    assert [creg.name for creg in tqc.cregs] == ['c']
+
+def test_only_undecodable_entries_are_dropped(tmp_path):
+    backend = AerSimulator()
+    qc = grover_circuit(3, 5, 1)
+    key = transpile_key(qc, backend)
+    (tmp_path / f"{key}.qpy").write_bytes(b"not a qpy file")
+    cache = TranspileCache(tmp_path)
+    assert cache.get(key) is None
+    assert not (tmp_path / f"{key}.qpy").exists()
+    assert cache.get(key) is None and cache.misses == 2
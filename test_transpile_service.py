@@ -0,0 +1,64 @@
+"""
+Tests for pass-manager reuse and transpile profiling
+"""
+
+from qiskit_aer import AerSimulator
+
+from quantum_sudoku_decrypt import grover_circuit
+from transpile_cache import cached_transpile
+from transpile_service import DEFAULT_SERVICE, TranspileProfile, TranspileService, grover_stage
+
+def test_pass_manager_is_built_once_per_key():
+    service = TranspileService()
+    backend = AerSimulator()
+    for secret in range(4):
+        service.transpile(grover_circuit(4, secret, 1), backend, 2, seed_transpiler=1)
+    assert service.builds == 1
+    service.transpile(grover_circuit(4, 0, 1), backend, 1, seed_transpiler=1)
+    assert service.builds == 2
+
+def test_parallel_list_matches_sequential():
+    service = TranspileService()
+    backend = AerSimulator()
+    circuits = [grover_circuit(4, s, 1) for s in range(4)]
+    batch = service.transpile(circuits, backend, 1, num_processes=2, seed_transpiler=1)
+    single = [service.transpile(qc, backend, 1, seed_transpiler=1) for qc in circuits]
+    assert [qc.count_ops() for qc in batch] == [qc.count_ops() for qc in single]
+
+def test_profile_records_every_pass_and_gate_deltas():
+    service = TranspileService()
+    profile = TranspileProfile()
+    qc = grover_circuit(5, 9, 1)
+    tqc = service.transpile(qc, AerSimulator(), 2, profile=profile)
+    assert profile.records
+    assert qc.size() + sum(r['delta'] for r in profile.records) == tqc.size()
+    assert {'pass', 'calls', 'seconds', 'delta'} <= set(profile.summary()[0])
+
+def test_grover_stage_is_inserted():
+    service = TranspileService()
+    profile = TranspileProfile()
+    stage = grover_stage()
+    backend = AerSimulator()
+    # Top bit set: the oracle's closing H on qubit 3 meets the diffuser's H
+    qc = grover_circuit(4, 9, 1)
+    plain = service.transpile(qc, backend, 0)
+    staged = service.transpile(qc, backend, 0, stages={'post_init': stage}, profile=profile)
+    assert 'InverseCancellation' in [r['pass'] for r in profile.records]
+    assert staged.size() < plain.size()
+
+def test_repeated_grover_stage_reuses_pass_manager():
+    service = TranspileService()
+    backend = AerSimulator()
+    for secret in range(3):
+        service.transpile(grover_circuit(4, secret, 1), backend, 0,
+                          stages={'post_init': grover_stage()})
+    assert service.builds == 1
+
+def test_cached_transpile_goes_through_shared_service():
+    backend = AerSimulator()
+    cached_transpile(grover_circuit(4, 3, 1), backend, optimization_level=1, seed_transpiler=5)
+    builds = DEFAULT_SERVICE.builds
+    for secret in range(3):
+        cached_transpile(grover_circuit(4, secret, 1), backend,
+                         optimization_level=1, seed_transpiler=5)
+    assert DEFAULT_SERVICE.builds == builds
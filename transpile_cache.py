@@ -0,0 +1,168 @@
+"""
+On-Disk QPY Cache of Transpiled Circuits
+Stores transpiled circuits as QPY files keyed by the circuit's structural
+hash, the backend and its target version, and the transpiler settings, so
+that many short-lived processes share transpile work. Writes are atomic
+(temp file + rename) and files are evicted least-recently-used once the
+directory exceeds its size limit
+"""
+
+import io
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from qiskit import qpy
+
+from readout_mitigation import _backend_name
+from result_cache import circuit_fingerprint, spec_fingerprint
+from transpile_service import DEFAULT_SERVICE, TargetFingerprints, target_fingerprint
+
+DEFAULT_CACHE_DIR = Path("transpile_cache")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MB of QPY files
+
+def transpile_key(qc, backend, target=None, **options):
+    """
+    Cache key for transpile(qc, backend, **options); target is a precomputed
+    target_fingerprint(backend)
+    """
+    return spec_fingerprint({
+        'circuit': circuit_fingerprint(qc),
+        'target': target if target is not None else target_fingerprint(backend),
+        'options': {name: repr(value) for name, value in options.items()},
+    })
+
+class TranspileCache:
+    """
+    Directory of QPY files, one per key. Safe for concurrent processes:
+    readers only ever see complete files, and a file evicted by another
+    process between listing and reading is treated as a miss.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.time_saved = 0.0
+        self._target = TargetFingerprints()
+
+    def _path(self, key):
+        return self.directory / f"{key}.qpy"
+
+    def get(self, key):
+        """Returns the cached transpiled circuit for key, or None on a miss"""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+                inode = os.fstat(f.fileno()).st_ino
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        try:
+            circuit = qpy.load(io.BytesIO(data))[0]
+        except Exception:
+            # Unreadable (e.g. written by an incompatible Qiskit): drop it,
+            # unless another process has already replaced it with a new file
+            try:
+                if path.stat().st_ino == inode:
+                    path.unlink()
+            except FileNotFoundError:
+                pass
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)  # mtime doubles as the LRU access time
+        except FileNotFoundError:
+            pass  # evicted by another process after the read
+        self.hits += 1
+        self.time_saved += circuit.metadata.get('transpile_seconds', 0.0) \
+            if isinstance(circuit.metadata, dict) else 0.0
+        return circuit
+
+    def put(self, key, circuit):
+        """Atomically writes a transpiled circuit and evicts old entries if needed"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                qpy.dump(circuit, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for path in self.directory.glob('*.qpy'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def transpile(self, qc, backend, **options):
+        """
+        Drop-in for transpile(qc, backend, **options) that reuses a cached
+        result when the same circuit was compiled for the same target and
+        settings before.
+        """
+        key = transpile_key(qc, backend, self._target(backend), **options)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        start = time.time()
+        tqc = DEFAULT_SERVICE.transpile(qc, backend, **options)
+        tqc.metadata = dict(tqc.metadata or {}, transpile_seconds=time.time() - start)
+        self.put(key, tqc)
+        return tqc
+
+    def report(self):
+        """Prints hit/miss statistics for this session"""
+        total = self.hits + self.misses
+        rate = self.hits / total * 100 if total else 0.0
+        print(f"\nTranspile cache ({self.directory}):")
+        print(f"  Hits: {self.hits}, Misses: {self.misses} ({rate:.1f}% hit rate)")
+        print(f"  Transpile time saved: {self.time_saved:.3f}s")
+
+def cached_transpile(qc, backend, cache=None, **options):
+    """
+    transpile() through an optional TranspileCache; misses (and uncached
+    calls) reuse the shared pass managers of transpile_service
+    """
+    if cache is None:
+        return DEFAULT_SERVICE.transpile(qc, backend, **options)
+    return cache.transpile(qc, backend, **options)
+
+def main():
+    """Transpiles a 10-qubit Grover circuit twice for a fake 156-qubit device"""
+    from qiskit_ibm_runtime.fake_provider import FakeFez
+
+    from quantum_sudoku_decrypt import grover_circuit
+
+    n, secret = 10, 613
+    qc = grover_circuit(n, secret, iterations=3)
+
+    backend = FakeFez()
+    cache = TranspileCache()
+
+    print("="*70)
+    print(f"TRANSPILE CACHE ({_backend_name(backend)}, optimization level 3)")
+    print("="*70)
+    for attempt in (1, 2):
+        start = time.time()
+        tqc = cache.transpile(qc, backend, optimization_level=3, seed_transpiler=7)
+        print(f"  Run {attempt}: {time.time() - start:.3f}s, depth {tqc.depth()}")
+    cache.report()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Pass-Manager Reuse and Transpile Profiling
+Builds the staged preset pass manager once per (backend, optimization level,
+options, extra stages) and reuses it, transpiles circuit lists in parallel
+processes, and records per-pass wall time and gate-count deltas through the
+pass-manager callback
+"""
+
+import functools
+import hashlib
+import time
+
+import qiskit
+from qiskit.circuit.library import CXGate, HGate, XGate
+from qiskit.transpiler import PassManager, generate_preset_pass_manager
+from qiskit.transpiler.passes import Decompose, InverseCancellation
+
+from readout_mitigation import _backend_name, calibration_timestamp
+from result_cache import spec_fingerprint
+
+def target_fingerprint(backend):
+    """
+    Identifies the compilation target: backend name and version, calibration
+    timestamp (for hardware/fake backends), the supported operations and the
+    coupling map, plus the Qiskit version that produced the QPY.
+    """
+    target = getattr(backend, 'target', None)
+    digest = hashlib.sha256()
+    if target is not None:
+        digest.update(repr(sorted(target.operation_names)).encode('utf-8'))
+        coupling_map = target.build_coupling_map()
+        if coupling_map is not None:
+            digest.update(repr(sorted(coupling_map.get_edges())).encode('utf-8'))
+    return spec_fingerprint({
+        'backend': _backend_name(backend),
+        'version': str(getattr(backend, 'backend_version', None)),
+        'calibration': calibration_timestamp(backend),
+        'num_qubits': getattr(backend, 'num_qubits', None),
+        'target': digest.hexdigest(),
+        'qiskit': qiskit.__version__,
+    })
+
+class TargetFingerprints:
+    """
+    target_fingerprint per backend object. Fingerprinting a 100+ qubit
+    target costs ~0.1s, so it is done once per backend.
+    """
+
+    def __init__(self):
+        self._entries = {}
+
+    def __call__(self, backend):
+        entry = self._entries.get(id(backend))
+        if entry is None or entry[0] is not backend:
+            entry = (backend, target_fingerprint(backend))
+            self._entries[id(backend)] = entry
+        return entry[1]
+
+@functools.cache
+def grover_stage():
+    """
+    Grover-aware cleanup for the post_init stage. Once the Oracle/Diffuser
+    wrappers are opened up, the oracle's closing H/X on the last qubit meets
+    the diffuser's opening H/X layer (and vice versa), leaving self-inverse
+    pairs that are cheaper to cancel before layout and routing than after.
+    The level 1-3 presets already cancel these in init; at level 0, which
+    skips optimization to save time, this stage recovers them.
+
+    Built once and shared, so every caller hits the same pass-manager key.
+    """
+    return PassManager([
+        Decompose(gates_to_decompose=["Oracle*", "Diffuser*"]),
+        InverseCancellation([HGate(), XGate(), CXGate()]),
+    ])
+
+class TranspileProfile:
+    """Per-pass records collected by the pass-manager callback"""
+
+    def __init__(self):
+        self.records = []
+        self._last_size = None
+
+    def callback(self, pass_, dag, time, property_set, count):
+        size = dag.size()
+        self.records.append({
+            'pass': type(pass_).__name__,
+            'seconds': time,
+            'gates': size,
+            'delta': 0 if self._last_size is None else size - self._last_size,
+        })
+        self._last_size = size
+
+    def start_circuit(self, qc):
+        """Resets the gate-count baseline before the next circuit"""
+        self._last_size = qc.size()
+
+    def summary(self):
+        """
+        Aggregates records per pass type, slowest first.
+
+        Returns:
+            List of dictionaries with 'pass', 'calls', 'seconds' and 'delta'
+        """
+        totals = {}
+        for record in self.records:
+            entry = totals.setdefault(record['pass'], {'pass': record['pass'], 'calls': 0,
+                                                       'seconds': 0.0, 'delta': 0})
+            entry['calls'] += 1
+            entry['seconds'] += record['seconds']
+            entry['delta'] += record['delta']
+        return sorted(totals.values(), key=lambda x: x['seconds'], reverse=True)
+
+    def report(self, top=10):
+        """Prints the slowest passes and their gate-count changes"""
+        total = sum(r['seconds'] for r in self.records)
+        print(f"\n  {'pass':<36} {'calls':>6} {'time':>9} {'share':>7} {'gates':>8}")
+        for entry in self.summary()[:top]:
+            share = entry['seconds'] / total * 100 if total else 0.0
+            print(f"  {entry['pass']:<36} {entry['calls']:6d} {entry['seconds']:8.3f}s "
+                  f"{share:6.1f}% {entry['delta']:+8d}")
+
+class TranspileService:
+    """
+    Reusable pass managers keyed by target, optimization level, options and
+    extra stages. Building a preset pass manager is paid once per key instead
+    of on every transpile() call.
+    """
+
+    def __init__(self):
+        self._pass_managers = {}
+        self._target = TargetFingerprints()
+        self.builds = 0
+
+    def pass_manager(self, backend, optimization_level=2, stages=None, **options):
+        """
+        Returns the staged pass manager for these settings, building it on
+        first use.
+
+        Args:
+            backend: Target backend
+            optimization_level: Preset level 0-3
+            stages: Optional {stage name: PassManager} inserted into the
+                preset, e.g. {'post_init': grover_stage()}
+            **options: Further generate_preset_pass_manager options
+                (seed_transpiler, layout_method, ...)
+        """
+        stages = stages or {}
+        key = (
+            self._target(backend),
+            optimization_level,
+            tuple(sorted((name, repr(value)) for name, value in options.items())),
+            # The stage object itself, not its id(): the key keeps it alive,
+            # so a collected stage's id can never alias a new one
+            tuple(sorted(stages.items(), key=lambda x: x[0])),
+        )
+        pm = self._pass_managers.get(key)
+        if pm is None:
+            pm = generate_preset_pass_manager(optimization_level, backend=backend, **options)
+            for name, stage in stages.items():
+                setattr(pm, name, stage)
+            self._pass_managers[key] = pm
+            self.builds += 1
+        return pm
+
+    def transpile(self, circuits, backend, optimization_level=2, stages=None,
+                  num_processes=None, profile=None, **options):
+        """
+        Transpiles one circuit or a list through the reused pass manager.
+
+        Args:
+            num_processes: Worker processes for circuit lists (None = Qiskit's
+                default parallelism)
+            profile: Optional TranspileProfile; profiled runs execute in this
+                process so the callback can see every pass
+        """
+        pm = self.pass_manager(backend, optimization_level, stages, **options)
+        if profile is None:
+            return pm.run(circuits, num_processes=num_processes)
+
+        single = not isinstance(circuits, (list, tuple))
+        results = []
+        for qc in ([circuits] if single else circuits):
+            profile.start_circuit(qc)
+            results.append(pm.run(qc, callback=profile.callback))
+        return results[0] if single else results
+
+DEFAULT_SERVICE = TranspileService()
+
+def main():
+    """Profiles optimization level 3 on a Grover circuit for a 156-qubit device"""
+    from qiskit import transpile
+    from qiskit_ibm_runtime.fake_provider import FakeFez
+
+    from quantum_sudoku_decrypt import grover_circuit
+
+    backend = FakeFez()
+    circuits = [grover_circuit(8, s, iterations=2) for s in (11, 97, 130, 201)]
+    service = TranspileService()
+
+    print("="*70)
+    print("TRANSPILE SERVICE (optimization level 3, FakeFez)")
+    print("="*70)
+
+    start = time.time()
+    for qc in circuits:
+        transpile(qc, backend, optimization_level=3, seed_transpiler=1)
+    print(f"  transpile() per circuit:       {time.time() - start:.2f}s")
+
+    service.pass_manager(backend, 3, seed_transpiler=1)
+    start = time.time()
+    for qc in circuits:
+        service.transpile(qc, backend, 3, seed_transpiler=1)
+    print(f"  Reused pass manager:           {time.time() - start:.2f}s")
+
+    start = time.time()
+    service.transpile(circuits, backend, 3, seed_transpiler=1)
+    print(f"  Reused, parallel list:         {time.time() - start:.2f}s")
+
+    profile = TranspileProfile()
+    service.transpile(circuits[0], backend, 3, profile=profile, seed_transpiler=1)
+    print("\n  Slowest passes (one circuit):")
+    profile.report()
+
+    stages = {'post_init': grover_stage()}
+    plain = service.transpile(circuits[0], backend, 0, seed_transpiler=1)
+    staged = service.transpile(circuits[0], backend, 0, stages=stages, seed_transpiler=1)
+    print(f"\n  Level 0 with Grover stage: {plain.size()} -> {staged.size()} gates, "
+          f"{service.builds} pass managers built")
+
+if __name__ == "__main__":
+    main()